@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+End-to-end Benchmark: Video Generation Pipeline
+
+Drives LinkedInVideoGenerator.generate (single and chained) against the
+local stand-in API (scripts/mock_api.py) and reports where the time goes.
+
+Each variant runs in its own subprocess with its own output directory,
+and its mock server runs in a separate process, so peak RSS measures
+only the pipeline and request counts and caches are isolated.
+
+Reports per variant:
+    - wall clock for the whole variant, p50/p95 per job
+    - time per stage: prompt, submit, poll, download, tts, ffmpeg
+    - peak RSS and API requests issued
+
+Usage:
+    python benchmarks/bench_pipeline.py                       # default matrix
+    python benchmarks/bench_pipeline.py --concurrency 1 10 50 --render-time 2
+    python benchmarks/bench_pipeline.py --compare benchmarks/results/a.json benchmarks/results/b.json
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+import resource
+import shutil
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Report column -> tracer span name in generate_video.py
+STAGES = {
+    "prompt": "prompt",
+    "submit": "runway.submit",
+    "poll": "runway.poll",
+    "download": "download",
+    "tts": "tts",
+    "ffmpeg": "ffmpeg",
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+# ========================================
+# Variant Runner (child process)
+# ========================================
+
+def write_synthetic_posts(posts_dir: Path, count: int, prefix: str) -> List[str]:
+    """Write `count` distinct posts so renders and narration aren't deduped."""
+    post_ids = []
+    for i in range(count):
+        post_id = f"{prefix}-{i + 1:03d}"
+        (posts_dir / f"{post_id}.md").write_text(
+            f"# {post_id}: Benchmark Post {i + 1}\n\n"
+            f"**Post ID:** {post_id}\n"
+            f"**Vertical:** Benchmark\n"
+            f"**Pain Point:** Synthetic Pain {i + 1}\n\n"
+            f"## Post Copy\n\n```\n"
+            f"Benchmark post {i + 1}: contractors lose {i + 10}% margin to late invoices.\n"
+            f"```\n"
+        )
+        post_ids.append(post_id)
+    return post_ids
+
+
+def serve_mock(options: dict, conn):
+    """Run the mock API until told to stop, then send back its request counts.
+
+    Runs in its own process so the mock's threads and in-memory assets
+    don't count towards the variant's peak RSS.
+    """
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from mock_api import MockAPIServer
+
+    server = MockAPIServer(**options).start()
+    conn.send(server.base_url)
+    conn.recv()  # Stop signal
+    conn.send(dict(server.state.requests))
+    server.stop()
+
+
+def run_variant(variant: dict) -> dict:
+    """Run one variant in this process and return its measurements."""
+    work_dir = Path(tempfile.mkdtemp(prefix="bench_"))
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+    mock_options = {
+        "render_time": variant["render_time"],
+        "queue_depth": variant["queue_depth"],
+        "latency": variant["latency"],
+        "seed": 0,
+    }
+    context = multiprocessing.get_context("spawn")
+    conn, child_conn = context.Pipe()
+    mock = context.Process(target=serve_mock, args=(mock_options, child_conn), daemon=True)
+    mock.start()
+    base_url = conn.recv()
+
+    # Configure before import: module constants are read at import time
+    os.environ.update({
+        "RUNWAY_API_URL": base_url,
+        "CARTESIA_API_URL": base_url,
+        "RUNWAY_API_KEY": "mock",
+        "CARTESIA_API_KEY": "mock",
+        "RUNWAY_POLL_INITIAL": str(variant["poll_initial"]),
+        "VIDEOS_DIR": str(work_dir / "videos"),
+    })
+    import generate_video as gv
+
+    posts_dir = work_dir / "posts"
+    posts_dir.mkdir()
+    gv.POSTS_DIR = posts_dir
+    post_ids = write_synthetic_posts(posts_dir, variant["concurrency"], "BX")
+
+    async def run_jobs():
+        async with gv.LinkedInVideoGenerator() as generator:
+            return await gv.run_batch(
+                generator, post_ids, [variant["style"]],
+                with_voice=variant["voice"],
+                max_parallel=variant["concurrency"],
+                chain_clips=variant["chain"],
+                duration=variant["duration"],
+            )
+
+    started = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = asyncio.run(run_jobs())
+    wall_clock = time.perf_counter() - started
+    conn.send("stop")
+    requests = conn.recv()
+    mock.join()
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+    stage_stats = gv.TRACER.summary()
+    empty = {"count": 0, "total": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    job_times = [r["elapsed"] for r in results]
+    return {
+        **variant,
+        "jobs": len(results),
+        "succeeded": sum(1 for r in results if r["status"] == "ok"),
+        "wall_clock": wall_clock,
+        "job_p50": percentile(job_times, 50),
+        "job_p95": percentile(job_times, 95),
+        "stages": {stage: stage_stats.get(span, empty) for stage, span in STAGES.items()},
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        "requests": requests,
+    }
+
+
+# ========================================
+# Matrix Driver
+# ========================================
+
+def variant_name(v: dict) -> str:
+    shape = f"chain{v['chain']}" if v["chain"] > 1 else "single"
+    return f"{shape}-{'voice' if v['voice'] else 'silent'}-x{v['concurrency']}"
+
+
+def build_matrix(args) -> List[dict]:
+    matrix = []
+    for chain in args.chain:
+        for voice in (True, False):
+            for concurrency in args.concurrency:
+                matrix.append({
+                    "chain": chain,
+                    "voice": voice,
+                    "concurrency": concurrency,
+                    "style": args.style,
+                    "duration": args.duration,
+                    "render_time": args.render_time,
+                    "queue_depth": args.queue_depth,
+                    "latency": args.latency,
+                    "poll_initial": args.poll_initial,
+                })
+    for v in matrix:
+        v["name"] = variant_name(v)
+    return matrix
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown"
+
+
+def print_report(results: List[dict]):
+    print(f"\n  {'Variant':<24} {'OK':>7} {'Wall':>7} {'p50':>7} {'p95':>7} "
+          f"{'Poll':>7} {'DL':>6} {'TTS':>6} {'ffmpeg':>7} {'RSS MB':>7} {'Reqs':>6}")
+    for r in results:
+        stages = r["stages"]
+        print(f"  {r['name']:<24} {r['succeeded']:>3}/{r['jobs']:<3} {r['wall_clock']:>6.1f}s "
+              f"{r['job_p50']:>6.1f}s {r['job_p95']:>6.1f}s "
+              f"{stages['poll']['p50']:>6.1f}s {stages['download']['p50']:>5.2f}s "
+              f"{stages['tts']['p50']:>5.2f}s {stages['ffmpeg']['p50']:>6.2f}s "
+              f"{r['peak_rss_mb']:>7.1f} {sum(r['requests'].values()):>6}")
+
+
+def compare(old_path: Path, new_path: Path):
+    """Print per-variant deltas between two result files."""
+    old = {v["name"]: v for v in json.loads(old_path.read_text())["variants"]}
+    new = {v["name"]: v for v in json.loads(new_path.read_text())["variants"]}
+    print(f"\n📊 {old_path.name} → {new_path.name}\n")
+    print(f"  {'Variant':<24} {'Wall':>16} {'Job p95':>16} {'Requests':>14}")
+    for name in new:
+        if name not in old:
+            continue
+        o, n = old[name], new[name]
+        o_reqs, n_reqs = sum(o["requests"].values()), sum(n["requests"].values())
+        wall_delta = (n["wall_clock"] - o["wall_clock"]) / o["wall_clock"] if o["wall_clock"] else 0
+        print(f"  {name:<24} {o['wall_clock']:>6.1f}→{n['wall_clock']:<6.1f}({wall_delta:+.0%}) "
+              f"{o['job_p95']:>6.1f}→{n['job_p95']:<8.1f} {o_reqs:>6}→{n_reqs:<6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the video generation pipeline offline")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 25, 50],
+                        help="Concurrent posts per variant (default: 1 5 25 50)")
+    parser.add_argument("--chain", type=int, nargs="+", default=[1, 2],
+                        help="Clips per video; 1 = single, 2+ = chained (default: 1 2)")
+    parser.add_argument("--style", default="abstract",
+                        help="Style to render; abstract keys its prompt on each post (default: abstract)")
+    parser.add_argument("--duration", type=int, default=4)
+    parser.add_argument("--render-time", type=float, default=2.0,
+                        help="Mock seconds per render (default: 2)")
+    parser.add_argument("--queue-depth", type=int, default=10,
+                        help="Mock concurrent render slots (default: 10)")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="Mock latency per API request in seconds (default: 0.02)")
+    parser.add_argument("--poll-initial", type=float, default=0.25,
+                        help="RUNWAY_POLL_INITIAL for the run (default: 0.25)")
+    parser.add_argument("--output", type=Path, help="Results file (default: benchmarks/results/<commit>_<time>.json)")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("OLD", "NEW"),
+                        help="Compare two result files instead of running")
+    parser.add_argument("--run-variant", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_variant:
+        print(json.dumps(run_variant(json.loads(args.run_variant))))
+        return
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    matrix = build_matrix(args)
+    print(f"\n⏱️  Benchmarking {len(matrix)} variants against the mock API\n")
+
+    results = []
+    for variant in matrix:
+        print(f"  ▶ {variant['name']}...", flush=True)
+        proc = subprocess.run(
+            [sys.executable, __file__, "--run-variant", json.dumps(variant)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"    ❌ failed: {proc.stderr.strip()[-300:]}")
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    print_report(results)
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"{commit}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "variants": results,
+    }, indent=2))
+    print(f"\n💾 Results: {output}")
+
+
+if __name__ == "__main__":
+    main()
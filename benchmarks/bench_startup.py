@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark: CLI Cold Start
+
+Times how long the everyday commands take from process start to exit,
+and breaks the import cost down with `python -X importtime`, so startup
+regressions (a new top-level import, a cache that stopped hitting) show
+up as numbers instead of a feeling.
+
+Each command runs in a fresh interpreter. Interpreter startup
+(`python -c pass`) is measured separately and reported as the baseline.
+
+Usage:
+    python benchmarks/bench_startup.py                   # default commands, 10 runs each
+    python benchmarks/bench_startup.py --runs 30 --top 15
+    python benchmarks/bench_startup.py --cold            # also time a run with no post index cache
+    python benchmarks/bench_startup.py --compare benchmarks/results/startup_a.json benchmarks/results/startup_b.json
+"""
+
+import sys
+import json
+import time
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+RESULTS_DIR = Path(__file__).parent / "results"
+INDEX_CACHE = PROJECT_ROOT / "posts" / ".post_index.json"
+
+COMMANDS = {
+    "post --list": ["post.py", "--list"],
+    "post --range 30": ["post.py", "--range", "30"],
+    "post --list --json": ["post.py", "--list", "--json"],
+    "post_index EC-001": ["post_index.py", "EC-001"],
+    "generate_video --list-styles": ["generate_video.py", "--list-styles"],
+}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+# ========================================
+# Measurement
+# ========================================
+
+def time_command(argv: List[str], runs: int) -> List[float]:
+    """Wall-clock seconds for `runs` fresh-interpreter runs of argv."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(argv, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def import_profile(argv: List[str]) -> Dict[str, Dict[str, float]]:
+    """Top-level imports of one run, from `-X importtime`, in milliseconds.
+
+    Only modules imported directly by the script (or by site) are kept;
+    their cumulative time already includes everything they pull in.
+    """
+    proc = subprocess.run(
+        [argv[0], "-X", "importtime", *argv[1:]],
+        cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if name.startswith("   "):
+            continue  # Nested import, counted in its parent
+        modules[name.strip()] = {
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        }
+    return modules
+
+
+def run_benchmark(args) -> dict:
+    python = sys.executable
+    baseline = time_command([python, "-c", "pass"], args.runs)
+
+    commands = []
+    for name, (script, *script_args) in COMMANDS.items():
+        argv = [python, str(SCRIPTS_DIR / script), *script_args]
+        print(f"  ▶ {name}...", flush=True)
+        time_command(argv, 1)  # Warm the OS page cache and the post index
+        times = time_command(argv, args.runs)
+        result = {
+            "name": name,
+            "p50": percentile(times, 50),
+            "p95": percentile(times, 95),
+            "min": min(times),
+            "imports": import_profile(argv),
+        }
+        if args.cold and script in ("post.py", "post_index.py"):
+            # The index cache is derived data; it is rebuilt by the next run
+            INDEX_CACHE.unlink(missing_ok=True)
+            result["cold"] = time_command(argv, 1)[0]
+        commands.append(result)
+
+    return {
+        "baseline_p50": percentile(baseline, 50),
+        "commands": commands,
+    }
+
+
+# ========================================
+# Reporting
+# ========================================
+
+def print_report(results: dict, top: int):
+    baseline = results["baseline_p50"]
+    print(f"\n  Interpreter startup (python -c pass): {baseline * 1000:.1f}ms\n")
+    print(f"  {'Command':<30} {'p50':>8} {'p95':>8} {'min':>8} {'-base':>8} {'cold':>8}")
+    for r in results["commands"]:
+        cold = f"{r['cold'] * 1000:>6.1f}ms" if "cold" in r else f"{'':>8}"
+        print(f"  {r['name']:<30} {r['p50'] * 1000:>6.1f}ms {r['p95'] * 1000:>6.1f}ms "
+              f"{r['min'] * 1000:>6.1f}ms {(r['p50'] - baseline) * 1000:>6.1f}ms {cold}")
+
+    for r in results["commands"]:
+        imports = sorted(r["imports"].items(), key=lambda item: -item[1]["cumulative_ms"])
+        print(f"\n  {r['name']}: top imports (cumulative)")
+        for name, cost in imports[:top]:
+            print(f"    {cost['cumulative_ms']:>7.1f}ms  {name}")
+
+
+def compare(old_path: Path, new_path: Path):
+    """Print per-command p50 deltas between two result files."""
+    old = {c["name"]: c for c in json.loads(old_path.read_text())["commands"]}
+    new = {c["name"]: c for c in json.loads(new_path.read_text())["commands"]}
+    print(f"\n📊 {old_path.name} → {new_path.name}\n")
+    for name, n in new.items():
+        if name not in old:
+            continue
+        o = old[name]
+        delta = (n["p50"] - o["p50"]) / o["p50"] if o["p50"] else 0
+        print(f"  {name:<30} {o['p50'] * 1000:>6.1f}ms → {n['p50'] * 1000:>6.1f}ms ({delta:+.0%})")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI cold-start time")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command (default: 10)")
+    parser.add_argument("--top", type=int, default=8, help="Top imports to show per command (default: 8)")
+    parser.add_argument("--cold", action="store_true",
+                        help="Also time one run per post command with the post index cache removed")
+    parser.add_argument("--output", type=Path,
+                        help="Results file (default: benchmarks/results/startup_<commit>_<time>.json)")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("OLD", "NEW"),
+                        help="Compare two result files instead of running")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    print(f"\n⏱️  Timing CLI startup ({args.runs} runs per command)\n")
+    results = run_benchmark(args)
+    print_report(results, args.top)
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"startup_{commit}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        **results,
+    }, indent=2))
+    print(f"\n💾 Results: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,10 @@ Usage:
     python scripts/generate_video.py --post EC-004 --style text-overlay --no-voice
     python scripts/generate_video.py --list-styles
     python scripts/generate_video.py --list-voices
+    python scripts/generate_video.py --batch EC-001 HV-001 --styles pain-point abstract
+    python scripts/generate_video.py --batch week1 --style pain-point --max-parallel 4
+    python scripts/generate_video.py --batch week1 --style pain-point --resume
+    python scripts/generate_video.py --post EC-004 --style abstract --profile --trace trace.jsonl
 """
 
 import os
@@ -18,33 +22,249 @@ import sys
 import json
 import asyncio
 import argparse
-import subprocess
 import base64
+import contextlib
+import contextvars
+import functools
+import hashlib
+import re
+import shutil
+import struct
+import time
+import random
+import uuid
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, List, Union
 
 import httpx
 from dotenv import load_dotenv
 
+from post_index import PostIndex
+
 # Load environment variables
 load_dotenv()
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 POSTS_DIR = PROJECT_ROOT / "posts"
-VIDEOS_DIR = PROJECT_ROOT / "videos" / "runway"
-PROMPTS_DIR = VIDEOS_DIR / "prompts"
+PROMPTS_DIR = PROJECT_ROOT / "videos" / "runway" / "prompts"
+# Output root (override to keep benchmark/test runs out of the repo)
+VIDEOS_DIR = Path(os.getenv("VIDEOS_DIR", PROJECT_ROOT / "videos" / "runway"))
+TASK_JOURNAL_FILE = VIDEOS_DIR / "tasks.jsonl"
+AUDIO_CACHE_DIR = VIDEOS_DIR / "audio" / "cache"
+RENDER_CACHE_DIR = VIDEOS_DIR / "cache"
 
 # API Keys
 RUNWAY_API_KEY = os.getenv("RUNWAY_API_KEY")
 CARTESIA_API_KEY = os.getenv("CARTESIA_API_KEY")
 CARTESIA_VOICE_ID = os.getenv("CARTESIA_VOICE_ID", "a0e99841-438c-4a64-b679-ae501e7d6091")
 CARTESIA_SPEED = float(os.getenv("CARTESIA_SPEED", "1.0"))
+AUDIO_CACHE_MAX_MB = float(os.getenv("AUDIO_CACHE_MAX_MB", "500"))
+RENDER_CACHE_MAX_MB = float(os.getenv("RENDER_CACHE_MAX_MB", "2000"))
+# Stream narration over SSE straight to disk (0 = buffer the whole WAV via /tts/bytes)
+CARTESIA_STREAMING = os.getenv("CARTESIA_STREAMING", "1") not in ("0", "false", "no")
+CARTESIA_SAMPLE_RATE = 44100
+
+# Runway models
+RUNWAY_TEXT_MODEL = "veo3.1_fast"  # Veo 3.1 Fast (quick generation)
+RUNWAY_IMAGE_MODEL = "gen4_turbo"  # Better for image-to-video
+
+# API URLs (override to point at a local stand-in, see scripts/mock_api.py)
+RUNWAY_API_URL = os.getenv("RUNWAY_API_URL", "https://api.dev.runwayml.com")
+CARTESIA_API_URL = os.getenv("CARTESIA_API_URL", "https://api.cartesia.ai")
+
+# HTTP connection pool (shared by Runway + Cartesia clients)
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+HTTP_HTTP2 = os.getenv("HTTP_HTTP2", "1") not in ("0", "false", "no")
+
+# Max concurrent ffmpeg encodes (CPU-bound)
+FFMPEG_WORKERS = int(os.getenv("FFMPEG_WORKERS", str(os.cpu_count() or 2)))
+
+# Runway task polling (adaptive backoff)
+RUNWAY_POLL_INITIAL = float(os.getenv("RUNWAY_POLL_INITIAL", "2.0"))
+RUNWAY_POLL_MAX = float(os.getenv("RUNWAY_POLL_MAX", "15.0"))
+RUNWAY_TASK_DEADLINE = float(os.getenv("RUNWAY_TASK_DEADLINE", "600"))
+
+# Provider rate limits: concurrent tasks/requests, requests per second, burst
+RUNWAY_MAX_INFLIGHT = int(os.getenv("RUNWAY_MAX_INFLIGHT", "5"))
+RUNWAY_RPS = float(os.getenv("RUNWAY_RPS", "10"))
+RUNWAY_BURST = int(os.getenv("RUNWAY_BURST", "10"))
+CARTESIA_MAX_INFLIGHT = int(os.getenv("CARTESIA_MAX_INFLIGHT", "4"))
+CARTESIA_RPS = float(os.getenv("CARTESIA_RPS", "5"))
+CARTESIA_BURST = int(os.getenv("CARTESIA_BURST", "5"))
+
+# Retries on 5xx/timeouts, and the circuit breaker that stops them
+API_RETRIES = int(os.getenv("API_RETRIES", "3"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "1.0"))
+BREAKER_THRESHOLD = int(os.getenv("BREAKER_THRESHOLD", "5"))
+BREAKER_RESET = float(os.getenv("BREAKER_RESET", "30"))
+
+# Append one JSON line per finished stage span (or pass --trace FILE)
+TRACE_FILE = os.getenv("TRACE_FILE")
+
+
+# ========================================
+# Instrumentation
+# ========================================
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed stage. Attributes can be added while it is open."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start", "duration", "attrs", "status")
+
+    def __init__(self, name: str, parent: Optional["Span"], attrs: dict):
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.parent_id = parent.span_id if parent else None
+        self.start = time.time()
+        self.duration = 0.0
+        self.attrs = attrs
+        self.status = "ok"
 
-# API URLs
-RUNWAY_API_URL = "https://api.runwayml.com/v1"
-CARTESIA_API_URL = "https://api.cartesia.ai"
+    def set(self, key: str, value):
+        self.attrs[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start": self.start,
+            "duration": round(self.duration, 6),
+            "status": self.status,
+            "attrs": self.attrs,
+        }
+
+
+class Tracer:
+    """Collects spans around pipeline stages.
+
+    Spans nest via contextvars, so concurrent jobs in a batch each get
+    their own trace. Finished spans are kept for the --profile summary,
+    optionally appended to a JSON-lines file, and optionally mirrored to
+    OpenTelemetry (if the opentelemetry package is installed).
+    """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self.jsonl_path: Optional[Path] = None
+        self._otel = None
+
+    def configure(self, jsonl_path: Optional[Path] = None, otel: bool = False):
+        self.jsonl_path = jsonl_path
+        if otel:
+            try:
+                from opentelemetry import trace as otel_trace
+            except ImportError:
+                print("⚠️  opentelemetry not installed (pip install opentelemetry-sdk); skipping OTel spans")
+            else:
+                self._otel = otel_trace.get_tracer("linkedin-hand-raiser.generate_video")
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs):
+        """Time a block as a child of the current span."""
+        span = Span(name, _current_span.get(), attrs)
+        token = _current_span.set(span)
+        otel_cm = self._otel.start_as_current_span(name) if self._otel else None
+        otel_span = otel_cm.__enter__() if otel_cm else None
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "cancelled" if isinstance(e, asyncio.CancelledError) else "error"
+            span.set("error", repr(e)[:200])
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            _current_span.reset(token)
+            if otel_span is not None:
+                for key, value in span.attrs.items():
+                    if isinstance(value, (str, bool, int, float)):
+                        otel_span.set_attribute(key, value)
+                otel_cm.__exit__(None, None, None)
+            self._finish(span)
+
+    def traced(self, name: str):
+        """Decorator form of span() for sync and async functions."""
+        def decorator(fn):
+            if asyncio.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name):
+                        return await fn(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def annotate(self, **attrs):
+        """Set attributes on the innermost open span, if any."""
+        span = _current_span.get()
+        if span is not None:
+            span.attrs.update(attrs)
+
+    def record(self, name: str, duration: float, **attrs):
+        """Add a stage measured elsewhere (e.g. Runway queue time from polling)."""
+        span = Span(name, _current_span.get(), attrs)
+        span.start -= duration
+        span.duration = duration
+        self._finish(span)
+
+    def _finish(self, span: Span):
+        self.spans.append(span)
+        if self.jsonl_path:
+            with open(self.jsonl_path, "a") as f:
+                f.write(json.dumps(span.to_dict(), default=str) + "\n")
+
+    def summary(self) -> dict:
+        """Per-stage count, total, p50, p95 and max durations."""
+        by_name: dict = {}
+        for span in self.spans:
+            by_name.setdefault(span.name, []).append(span.duration)
+
+        stats = {}
+        for name, durations in by_name.items():
+            ordered = sorted(durations)
+            stats[name] = {
+                "count": len(ordered),
+                "total": sum(ordered),
+                "p50": ordered[len(ordered) // 2],
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max": ordered[-1],
+            }
+        return stats
+
+    def print_profile(self):
+        """Print the stage breakdown for --profile."""
+        stats = self.summary()
+        if not stats:
+            return
+        print("\n" + "="*50)
+        print("⏱️  STAGE PROFILE")
+        print("="*50 + "\n")
+        print(f"  {'Stage':<20} {'Count':>5} {'Total':>9} {'p50':>8} {'p95':>8} {'Max':>8}")
+        print(f"  {'-'*20} {'-'*5} {'-'*9} {'-'*8} {'-'*8} {'-'*8}")
+        for name, st in sorted(stats.items(), key=lambda item: -item[1]["total"]):
+            print(f"  {name:<20} {st['count']:>5} {st['total']:>8.2f}s {st['p50']:>7.2f}s "
+                  f"{st['p95']:>7.2f}s {st['max']:>7.2f}s")
+
+
+TRACER = Tracer()
+if TRACE_FILE:
+    TRACER.configure(Path(TRACE_FILE))
 
 
 # ========================================
@@ -105,28 +325,30 @@ VIDEO_STYLES = load_video_styles()
 # Post Reader
 # ========================================
 
-def find_post_file(post_id: str) -> Optional[Path]:
-    """Find the post file by ID across all folders."""
-    # Search patterns
-    patterns = [
-        f"**/{post_id}.md",
-        f"**/{post_id.lower()}.md",
-        f"**/{post_id.upper()}.md",
-    ]
+_post_index: Optional[PostIndex] = None
 
-    for pattern in patterns:
-        matches = list(POSTS_DIR.glob(pattern))
-        if matches:
-            return matches[0]
 
-    return None
+def get_post_index() -> PostIndex:
+    """Shared post index for POSTS_DIR, built (from its cache) on first use."""
+    global _post_index
+    if _post_index is None or _post_index.posts_dir != POSTS_DIR:
+        _post_index = PostIndex.load(POSTS_DIR)
+    return _post_index
 
 
+def find_post_file(post_id: str) -> Optional[Path]:
+    """Find the post file by ID across all folders."""
+    index = get_post_index()
+    record = index.get(post_id)
+    return index.path(record) if record else None
+
+
+@TRACER.traced("read_post")
 def read_post(post_id: str) -> dict:
     """Read post content and extract key elements."""
-    post_path = find_post_file(post_id)
+    record = get_post_index().get(post_id)
 
-    if not post_path:
+    if not record:
         # Return sample data if post not found
         print(f"⚠️  Post {post_id} not found, using sample content")
         return {
@@ -138,11 +360,12 @@ def read_post(post_id: str) -> dict:
             "vertical": post_id[:2].upper()
         }
 
-    content = post_path.read_text()
+    # The post copy, or the whole file if it has no ``` block
+    content = record.copy or get_post_index().path(record).read_text()
 
-    # Extract metadata from markdown frontmatter if present
-    pain_point = "Business Pain"
-    vertical = post_id[:2].upper()
+    # **Vertical:** / **Pain Point:** metadata, with the old defaults as fallback
+    pain_point = record.pain_point or "Business Pain"
+    vertical = record.vertical or post_id[:2].upper()
 
     # Simple extraction of first sentence/key phrase
     lines = [l.strip() for l in content.split('\n') if l.strip() and not l.startswith('#')]
@@ -158,64 +381,955 @@ def read_post(post_id: str) -> dict:
     }
 
 
+# ========================================
+# Shared HTTP Client
+# ========================================
+
+def create_http_client(
+    max_connections: int = HTTP_MAX_CONNECTIONS,
+    max_keepalive: int = HTTP_MAX_KEEPALIVE,
+    keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+    http2: bool = HTTP_HTTP2,
+    timeout: float = 60.0,
+) -> httpx.AsyncClient:
+    """Create a long-lived, connection-pooled async HTTP client.
+
+    HTTP/2 is only enabled when the optional `h2` package is installed
+    (pip install "httpx[http2]"); otherwise the pool falls back to HTTP/1.1
+    keep-alive connections.
+    """
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            http2 = False
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return httpx.AsyncClient(limits=limits, http2=http2, timeout=timeout)
+
+
+# ========================================
+# Streaming Downloads
+# ========================================
+
+# Responses worth retrying: rate limited or a transient server error
+TRANSIENT_STATUS = {429, 500, 502, 503, 504}
+
+
+class DownloadError(Exception):
+    """A download failed after all retries or did not verify."""
+
+
+class TransientStatusError(Exception):
+    """A retryable HTTP status, with the server's Retry-After if given."""
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def download_progress(label: str, step: float = 0.25) -> Callable[[int, Optional[int]], None]:
+    """Progress callback that prints every `step` fraction of the download."""
+    next_mark = [step]
+
+    def report(downloaded: int, total: Optional[int]):
+        if not total:
+            return
+        while downloaded / total >= next_mark[0] and next_mark[0] <= 1.0:
+            print(f"{label}: {next_mark[0]:.0%} ({downloaded:,}/{total:,} bytes)")
+            next_mark[0] += step
+
+    return report
+
+
+@TRACER.traced("download")
+async def stream_download(
+    http: httpx.AsyncClient,
+    url: str,
+    output_path: Path,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    expected_size: Optional[int] = None,
+    sha256: Optional[str] = None,
+    retries: int = 3,
+    chunk_size: int = 1024 * 1024,
+) -> int:
+    """Stream a URL to disk in chunks, resuming with HTTP Range on failure.
+
+    Data goes to `<output>.part` and is atomically renamed into place only
+    after the size (and optional SHA-256) verify, so peak memory is one
+    chunk regardless of video length.
+
+    Returns:
+        Number of bytes written
+    """
+    part_path = output_path.with_name(output_path.name + ".part")
+    part_path.unlink(missing_ok=True)
+    total = expected_size
+
+    for attempt in range(retries + 1):
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            async with http.stream("GET", url, headers=headers, timeout=120.0) as response:
+                if response.status_code == 416 and offset:
+                    # Everything was already received before the failure
+                    break
+                if response.status_code == 206:
+                    content_range = response.headers.get("Content-Range", "")
+                    if "/" in content_range and content_range.rsplit("/", 1)[1].isdigit():
+                        total = int(content_range.rsplit("/", 1)[1])
+                    mode = "ab"
+                elif response.status_code == 200:
+                    # Server ignored the Range header: start over
+                    offset = 0
+                    length = response.headers.get("Content-Length")
+                    if length and length.isdigit():
+                        total = int(length)
+                    mode = "wb"
+                elif response.status_code in TRANSIENT_STATUS:
+                    raise TransientStatusError(
+                        response.status_code, parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                else:
+                    raise DownloadError(f"HTTP {response.status_code}")
+
+                downloaded = offset
+                with open(part_path, mode) as f:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress:
+                            progress(downloaded, total)
+            break
+        except DownloadError:
+            part_path.unlink(missing_ok=True)
+            raise
+        except (httpx.TransportError, TransientStatusError) as e:
+            if attempt == retries:
+                part_path.unlink(missing_ok=True)
+                raise DownloadError(str(e)) from e
+            await asyncio.sleep(max(2 ** attempt, getattr(e, "retry_after", None) or 0))
+
+    size = part_path.stat().st_size
+    if total is not None and size != total:
+        part_path.unlink(missing_ok=True)
+        raise DownloadError(f"size mismatch: got {size:,} bytes, expected {total:,}")
+
+    if sha256:
+        digest = hashlib.sha256()
+        with open(part_path, "rb") as f:
+            for block in iter(lambda: f.read(chunk_size), b""):
+                digest.update(block)
+        if digest.hexdigest() != sha256:
+            part_path.unlink(missing_ok=True)
+            raise DownloadError("checksum mismatch")
+
+    part_path.replace(output_path)
+    TRACER.annotate(bytes=size)
+    return size
+
+
+# ========================================
+# Audio Cache
+# ========================================
+
+class AudioCache:
+    """Content-addressed, size-bounded LRU cache for synthesized audio.
+
+    Files are named by the hash of everything that affects the output
+    (transcript, voice, speed, model, format). A hit bumps the file's
+    mtime; when the cache grows past `max_bytes` the least recently used
+    files are evicted.
+    """
+
+    def __init__(self, cache_dir: Path = AUDIO_CACHE_DIR, max_mb: float = AUDIO_CACHE_MAX_MB):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(**params) -> str:
+        """Stable hash of the synthesis parameters."""
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    def _path(self, key: str, ext: str = "wav") -> Path:
+        return self.cache_dir / f"{key}.{ext}"
+
+    def get(self, key: str, ext: str = "wav") -> Optional[bytes]:
+        """Return cached audio bytes, or None on a miss."""
+        path = self._path(key, ext)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        os.utime(path)  # Mark as recently used
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes, ext: str = "wav"):
+        """Store audio bytes and evict old entries past the size bound."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key, ext)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        self.evict()
+
+    def put_file(self, key: str, source: Path, ext: str = "wav"):
+        """Store an audio file by copying it (no full read into memory)."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key, ext)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        shutil.copyfile(source, tmp_path)
+        tmp_path.replace(path)
+        self.evict()
+
+    def get_file(self, key: str, dest: Path, ext: str = "wav") -> bool:
+        """Copy cached audio to `dest`. Returns False on a miss."""
+        path = self._path(key, ext)
+        try:
+            shutil.copyfile(path, dest)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        os.utime(path)
+        self.hits += 1
+        return True
+
+    def evict(self):
+        """Delete least recently used files until under the size bound."""
+        files = []
+        for f in self.cache_dir.glob("*"):
+            if f.suffix == ".tmp":
+                continue
+            stat = f.stat()
+            files.append((stat.st_mtime, stat.st_size, f))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, f in sorted(files):
+            if total <= self.max_bytes:
+                break
+            f.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# ========================================
+# Render Cache
+# ========================================
+
+def is_video_file(path: Path) -> bool:
+    """True if path looks like a real MP4 (not a demo/error placeholder)."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(8)[4:8] == b"ftyp"
+    except OSError:
+        return False
+
+
+class RenderCache:
+    """Raw Runway renders stored under the hash of their render parameters.
+
+    An entry is either one video (`<key>.mp4`) or, for a chain rendered in
+    a single pass, the chain's individual clips (`<key>/clip_NN.mp4`).
+    Like the audio cache it is LRU-bounded: a hit bumps the entry's mtime
+    and past `max_bytes` the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Path = RENDER_CACHE_DIR, max_mb: float = RENDER_CACHE_MAX_MB):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(**params) -> str:
+        """Stable hash of the prompts and model parameters."""
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+    def has(self, key: str) -> bool:
+        """True if a render is cached for key (does not count as a lookup)."""
+        return (self.cache_dir / f"{key}.mp4").exists() or (self.cache_dir / key).is_dir()
+
+    def get(self, key: str) -> Optional[List[Path]]:
+        """Cached clip(s) for key, in chain order, or None on a miss."""
+        path = self.cache_dir / f"{key}.mp4"
+        entry = path if path.exists() else self.cache_dir / key
+        clips = [path] if entry is path else sorted(entry.glob("clip_*.mp4"))
+        if clips:
+            os.utime(entry)  # Mark as recently used
+            self.hits += 1
+            return clips
+        self.misses += 1
+        return None
+
+    @staticmethod
+    def _link(source: Path, dest: Path):
+        """Hard-link source into the cache (no second copy on disk), or copy
+        it when the cache is on another filesystem."""
+        try:
+            os.link(source, dest)
+        except OSError:
+            shutil.copyfile(source, dest)
+
+    def put(self, key: str, video_path: Path):
+        """Store a rendered clip in the cache.
+
+        Blocking (a copy, when linking fails, and the eviction scan):
+        call it through asyncio.to_thread from async code.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_dir / f"{key}.mp4.tmp"
+        tmp_path.unlink(missing_ok=True)
+        self._link(video_path, tmp_path)
+        tmp_path.replace(self.cache_dir / f"{key}.mp4")
+        self.evict()
+
+    def put_clips(self, key: str, clip_paths: List[Path]):
+        """Store a chain's clips in the cache as one entry (blocking, like put)."""
+        tmp_dir = self.cache_dir / f"{key}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        for i, clip_path in enumerate(clip_paths):
+            self._link(clip_path, tmp_dir / f"clip_{i:02d}.mp4")
+        entry = self.cache_dir / key
+        shutil.rmtree(entry, ignore_errors=True)
+        tmp_dir.replace(entry)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until under the size bound."""
+        entries = []
+        for entry in self.cache_dir.glob("*"):
+            if entry.suffix == ".tmp":
+                continue
+            try:
+                files = list(entry.glob("*")) if entry.is_dir() else [entry]
+                size = sum(f.stat().st_size for f in files)
+                entries.append((entry.stat().st_mtime, size, entry))
+            except FileNotFoundError:
+                continue  # Evicted or replaced by a concurrent put
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+            else:
+                entry.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+
+
+# ========================================
+# Rate Limiting
+# ========================================
+
+class RateLimiter:
+    """Token bucket + in-flight semaphore for one provider.
+
+    Every API request takes a token (`rps` refill, `burst` capacity) and
+    long-lived work (a Runway task, a TTS request) holds one of
+    `max_inflight` slots. Callers queue instead of failing, and a 429 pauses
+    the whole bucket for Retry-After so parallel jobs don't pile on.
+    A non-positive rps or max_inflight disables that limit.
+    """
+
+    def __init__(self, name: str, rps: float, burst: int, max_inflight: int):
+        self.name = name
+        self.rps = rps
+        self.burst = max(1, burst)
+        self.max_inflight = max_inflight
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_inflight) if max_inflight > 0 else None
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_wait = 0.0
+        self.throttled = 0
+
+    def _enqueue(self) -> float:
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        return time.monotonic()
+
+    def _dequeue(self, queued_at: float):
+        self.waiting -= 1
+        waited = time.monotonic() - queued_at
+        self.total_wait += waited
+        if waited > 0.001:
+            TRACER.record(f"{self.name}.queue", waited, waiting=self.waiting)
+
+    async def throttle(self):
+        """Wait for a request token (FIFO)."""
+        if self.rps <= 0 and time.monotonic() >= self._paused_until:
+            return
+        queued_at = self._enqueue()
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self._paused_until:
+                        await asyncio.sleep(self._paused_until - now)
+                        continue
+                    if self.rps <= 0:
+                        break
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rps)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self._tokens) / self.rps)
+        finally:
+            self._dequeue(queued_at)
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Hold one of the provider's in-flight slots for the block."""
+        if self._slots is not None:
+            queued_at = self._enqueue()
+            try:
+                await self._slots.acquire()
+            finally:
+                self._dequeue(queued_at)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    async def request(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        max_requeues: int = 10,
+    ) -> httpx.Response:
+        """Send a request under the token bucket, requeueing it on 429."""
+        for _ in range(max_requeues):
+            await self.throttle()
+            response = await send()
+            if response.status_code != 429:
+                break
+            self.backoff(parse_retry_after(response.headers.get("Retry-After")))
+        return response
+
+    def backoff(self, seconds: Optional[float]):
+        """Pause all requests after a 429 (Retry-After, or 1s if absent)."""
+        self.throttled += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + (seconds or 1.0))
+
+    def stats(self) -> dict:
+        return {
+            "waiting": self.waiting,
+            "peak_waiting": self.peak_waiting,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "total_wait": self.total_wait,
+            "throttled": self.throttled,
+        }
+
+
+# ========================================
+# Retries and Circuit Breaker
+# ========================================
+
+class ProviderUnavailable(Exception):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Fails fast once a provider is clearly down.
+
+    After `threshold` consecutive failed attempts (5xx, timeouts, connection
+    errors) the circuit opens and calls raise ProviderUnavailable for
+    `reset_after` seconds. Then a single trial call is let through; success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, name: str, threshold: int = BREAKER_THRESHOLD, reset_after: float = BREAKER_RESET):
+        self.name = name
+        self.threshold = max(1, threshold)
+        self.reset_after = reset_after
+        self.failures = 0
+        self.trips = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_after:
+            return "half-open"
+        return "open"
+
+    def check(self):
+        """Raise ProviderUnavailable unless a call may go through now."""
+        state = self.state
+        if state == "open" or (state == "half-open" and self._trial):
+            raise ProviderUnavailable(
+                f"{self.name} unavailable: circuit open after {self.failures} consecutive failures"
+            )
+        if state == "half-open":
+            self._trial = True
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a trial call through (0 otherwise)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_after - time.monotonic())
+
+    def release_trial(self):
+        """Free the half-open trial after a call that ended without a verdict.
+
+        A trial cancelled or failed by an unexpected error says nothing about
+        the provider; without this the circuit would stay shut for good.
+        """
+        self._trial = False
+
+    def record_success(self):
+        self.failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial = False
+        if self.failures >= self.threshold:
+            if self._opened_at is None:
+                self.trips += 1
+                print(f"🔌 {self.name} circuit opened after {self.failures} consecutive failures")
+            self._opened_at = time.monotonic()
+
+
+async def send_with_retry(
+    send: Callable[[], Awaitable[httpx.Response]],
+    limiter: RateLimiter,
+    breaker: CircuitBreaker,
+    idempotent: bool = True,
+    retries: int = API_RETRIES,
+) -> httpx.Response:
+    """Send a provider request through its rate limiter and circuit breaker.
+
+    Idempotent requests are retried with exponential backoff on 5xx,
+    timeouts and transport errors. Non-idempotent ones (task submits) are
+    retried only when the server cannot have acted on them: connection
+    failures and 502/503. 429s are requeued by the limiter and never count
+    against the breaker.
+
+    Returns:
+        The last response (which may still be an error status)
+    """
+    if idempotent:
+        retry_status, retry_errors = TRANSIENT_STATUS, (httpx.TransportError,)
+    else:
+        retry_status, retry_errors = {502, 503}, (httpx.ConnectError, httpx.ConnectTimeout)
+
+    for attempt in range(retries + 1):
+        breaker.check()
+        retry_after = None
+        try:
+            response = await limiter.request(send)
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            if attempt == retries or not isinstance(e, retry_errors):
+                raise
+            reason = type(e).__name__
+        except BaseException:
+            breaker.release_trial()
+            raise
+        else:
+            if response.status_code < 500:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if attempt == retries or response.status_code not in retry_status:
+                return response
+            reason = f"HTTP {response.status_code}"
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+        delay = max(RETRY_BASE_DELAY * 2 ** attempt * random.uniform(0.5, 1.0), retry_after or 0.0)
+        print(f"   ↻ {breaker.name}: {reason}, retry {attempt + 1}/{retries} in {delay:.1f}s")
+        TRACER.annotate(retries=attempt + 1)
+        await asyncio.sleep(delay)
+
+
 # ========================================
 # Cartesia Voice Client
 # ========================================
 
+def wav_header(data_size: int, sample_rate: int = CARTESIA_SAMPLE_RATE, channels: int = 1) -> bytes:
+    """44-byte RIFF header for 16-bit PCM with `data_size` bytes of samples."""
+    byte_rate = sample_rate * channels * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, byte_rate, channels * 2, 16,
+        b"data", data_size,
+    )
+
+
 class CartesiaClient:
     """Client for Cartesia TTS API."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        http: Optional[httpx.AsyncClient] = None,
+        cache: Optional[AudioCache] = None,
+        limiter: Optional[RateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
         self.api_key = api_key
         self.base_url = CARTESIA_API_URL
+        self._owns_http = http is None
+        self.http = http or create_http_client()
+        self.cache = cache
+        self.limiter = limiter or RateLimiter(
+            "cartesia", CARTESIA_RPS, CARTESIA_BURST, CARTESIA_MAX_INFLIGHT
+        )
+        self.breaker = breaker or CircuitBreaker("cartesia")
+
+    async def aclose(self):
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http:
+            await self.http.aclose()
+
+    def _payload(self, text: str, voice_id: str, container: str = "wav") -> dict:
+        return {
+            "model_id": "sonic-3",  # Latest model with emotional tagging
+            "transcript": text,
+            "voice": {
+                "mode": "id",
+                "id": voice_id,
+            },
+            "language": "en",
+            "output_format": {
+                "container": container,
+                "encoding": "pcm_s16le",
+                "sample_rate": CARTESIA_SAMPLE_RATE,
+            },
+        }
+
+    def _cache_key(self, text: str, voice_id: str, speed: float) -> Optional[str]:
+        # Keyed on the WAV request, so streamed and buffered narration share entries
+        if not self.cache:
+            return None
+        payload = self._payload(text, voice_id)
+        return AudioCache.key(
+            transcript=text,
+            voice_id=voice_id,
+            speed=speed,
+            model_id=payload["model_id"],
+            output_format=payload["output_format"],
+        )
 
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Cartesia-Version": "2025-04-16",
+            "Content-Type": "application/json",
+        }
+
+    @TRACER.traced("tts")
     async def synthesize(
         self,
         text: str,
         voice_id: str = CARTESIA_VOICE_ID,
         speed: float = CARTESIA_SPEED,
     ) -> bytes:
-        """Synthesize text to audio."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
+        """Synthesize text to audio.
+
+        Identical requests are served from the audio cache when one is set.
+        """
+        payload = self._payload(text, voice_id)
+
+        TRACER.annotate(chars=len(text), cache_hit=False)
+        cache_key = self._cache_key(text, voice_id, speed)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                TRACER.annotate(cache_hit=True)
+                print("♻️  Using cached narration")
+                return cached
+
+        async with self.limiter.slot():
+            # Synthesis has no side effects, so it is safe to retry
+            response = await send_with_retry(lambda: self.http.post(
                 f"{self.base_url}/tts/bytes",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Cartesia-Version": "2025-04-16",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model_id": "sonic-3",  # Latest model with emotional tagging
-                    "transcript": text,
-                    "voice": {
-                        "mode": "id",
-                        "id": voice_id,
-                    },
-                    "language": "en",
-                    "output_format": {
-                        "container": "wav",
-                        "encoding": "pcm_s16le",
-                        "sample_rate": 44100,
-                    },
-                }
-            )
+                headers=self._headers(),
+                json=payload,
+                timeout=60.0,
+            ), self.limiter, self.breaker)
 
-            if response.status_code != 200:
-                raise Exception(f"Cartesia error: {response.text}")
+        if response.status_code != 200:
+            raise Exception(f"Cartesia error: {response.text}")
 
-            return response.content
+        if cache_key:
+            self.cache.put(cache_key, response.content)
+
+        return response.content
+
+    @TRACER.traced("tts")
+    async def synthesize_to_file(
+        self,
+        text: str,
+        output_path: Path,
+        voice_id: str = CARTESIA_VOICE_ID,
+        speed: float = CARTESIA_SPEED,
+        retries: int = API_RETRIES,
+    ) -> Path:
+        """Stream synthesis over SSE, writing a WAV as the audio arrives.
+
+        Raw PCM chunks are appended to `<output>.part` behind a placeholder
+        header that is patched once the stream ends, so memory stays flat
+        however long the narration is. Transient failures are retried until
+        the first audio chunk arrives. Time-to-first-audio is printed and
+        recorded on the trace span.
+        """
+        TRACER.annotate(chars=len(text), cache_hit=False, streamed=True)
+        cache_key = self._cache_key(text, voice_id, speed)
+        if cache_key and self.cache.get_file(cache_key, output_path):
+            TRACER.annotate(cache_hit=True)
+            print("♻️  Using cached narration")
+            return output_path
+
+        payload = self._payload(text, voice_id, container="raw")
+        part_path = output_path.with_name(output_path.name + ".part")
+
+        async with self.limiter.slot():
+            for attempt in range(retries + 1):
+                self.breaker.check()
+                await self.limiter.throttle()
+                started = time.perf_counter()
+                first_audio = None
+                size = 0
+                try:
+                    async with self.http.stream(
+                        "POST", f"{self.base_url}/tts/sse",
+                        headers=self._headers(), json=payload, timeout=60.0,
+                    ) as response:
+                        # Any non-5xx answer means the provider is up
+                        if response.status_code < 500:
+                            self.breaker.record_success()
+                        if response.status_code in TRANSIENT_STATUS:
+                            raise TransientStatusError(
+                                response.status_code,
+                                parse_retry_after(response.headers.get("Retry-After")),
+                            )
+                        if response.status_code != 200:
+                            await response.aread()
+                            raise Exception(f"Cartesia error: {response.text}")
+
+                        with open(part_path, "wb") as f:
+                            f.write(wav_header(0))
+                            async for line in response.aiter_lines():
+                                if not line.startswith("data:"):
+                                    continue
+                                event = json.loads(line[5:])
+                                if event.get("type") == "error":
+                                    raise Exception(f"Cartesia error: {event.get('error')}")
+                                if event.get("data"):
+                                    chunk = base64.b64decode(event["data"])
+                                    if first_audio is None:
+                                        first_audio = time.perf_counter() - started
+                                        print(f"🔊 First audio after {first_audio * 1000:.0f}ms")
+                                    f.write(chunk)
+                                    size += len(chunk)
+                                if event.get("done"):
+                                    break
+                            f.seek(0)
+                            f.write(wav_header(size))
+                    break
+                except (httpx.TransportError, TransientStatusError) as e:
+                    part_path.unlink(missing_ok=True)
+                    if isinstance(e, TransientStatusError) and e.status_code == 429:
+                        self.limiter.backoff(e.retry_after)
+                    else:
+                        self.breaker.record_failure()
+                    if first_audio is not None or attempt == retries:
+                        raise
+                    delay = max(RETRY_BASE_DELAY * 2 ** attempt * random.uniform(0.5, 1.0),
+                                getattr(e, "retry_after", None) or 0.0)
+                    print(f"   ↻ cartesia: {e}, retry {attempt + 1}/{retries} in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                except BaseException:
+                    self.breaker.release_trial()
+                    part_path.unlink(missing_ok=True)
+                    raise
+
+        if size == 0:
+            part_path.unlink(missing_ok=True)
+            raise Exception("Cartesia error: stream ended without audio")
+        part_path.replace(output_path)
+        TRACER.annotate(first_audio=first_audio, bytes=size)
+
+        if cache_key:
+            self.cache.put_file(cache_key, output_path)
+        return output_path
 
     async def list_voices(self) -> list:
         """List available voices."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/voices",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Cartesia-Version": "2025-04-16"
-                }
-            )
-            return response.json()
+        response = await send_with_retry(lambda: self.http.get(
+            f"{self.base_url}/voices",
+            headers=self._headers(),
+            timeout=30.0,
+        ), self.limiter, self.breaker)
+        return response.json()
+
+
+# ========================================
+# Task Polling
+# ========================================
+
+class PollSchedule:
+    """Adaptive delay schedule for polling long-running tasks.
+
+    A few fast polls catch tasks that finish quickly, then the interval
+    grows exponentially up to `max_interval`. Each delay is jittered so
+    many in-flight tasks don't poll in lockstep.
+    """
+
+    def __init__(
+        self,
+        initial: float = RUNWAY_POLL_INITIAL,
+        max_interval: float = RUNWAY_POLL_MAX,
+        factor: float = 1.5,
+        fast_polls: int = 3,
+        jitter: float = 0.2,
+    ):
+        self.initial = initial
+        self.max_interval = max_interval
+        self.factor = factor
+        self.fast_polls = fast_polls
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before poll number `attempt` (0-based)."""
+        if attempt < self.fast_polls:
+            base = self.initial
+        else:
+            base = self.initial * self.factor ** (attempt - self.fast_polls + 1)
+        base = min(base, self.max_interval)
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# ========================================
+# Task Journal
+# ========================================
+
+class TaskJournal:
+    """Append-only JSONL log of submitted Runway tasks.
+
+    Every submit and every final status is appended as one line, so a run
+    that dies mid-poll can re-attach to its tasks with --resume instead of
+    paying for the render again. The latest line per job wins.
+    """
+
+    def __init__(self, path: Path = TASK_JOURNAL_FILE):
+        self.path = path
+        self._entries: Optional[dict] = None
+
+    @staticmethod
+    def prompt_hash(payload: dict) -> str:
+        """Hash the render parameters (excluding the source image)."""
+        key = {k: v for k, v in payload.items() if k != "promptImage"}
+        return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _job_key(job: dict, prompt_hash: str) -> str:
+        return f"{job.get('post_id')}|{job.get('style')}|{job.get('clip', 0)}|{prompt_hash}"
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            if self.path.exists():
+                with open(self.path) as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # Torn write from a killed process
+                        self._entries[entry["key"]] = entry
+        return self._entries
+
+    def record(
+        self,
+        job: dict,
+        prompt_hash: str,
+        task_id: str,
+        status: str,
+        output_url: Optional[str] = None,
+    ):
+        """Append a task event to the journal."""
+        entry = {
+            "key": self._job_key(job, prompt_hash),
+            "post_id": job.get("post_id"),
+            "style": job.get("style"),
+            "clip": job.get("clip", 0),
+            "prompt_hash": prompt_hash,
+            "task_id": task_id,
+            "status": status,
+            "output_url": output_url,
+            "updated": datetime.now().isoformat(),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._load()[entry["key"]] = entry
+
+    def find(self, job: dict, prompt_hash: str) -> Optional[dict]:
+        """Latest resumable (submitted, running or finished) entry for a job.
+
+        Tasks Runway failed, cancelled or no longer knows (REJECTED) are
+        skipped, so the job is submitted afresh.
+        """
+        entry = self._load().get(self._job_key(job, prompt_hash))
+        if entry and entry["status"] not in ("FAILED", "CANCELLED", "REJECTED"):
+            return entry
+        return None
 
 
 # ========================================
@@ -229,15 +1343,38 @@ class RunwayClient:
     Models: gen4_turbo, gen3a_turbo, veo3.1
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        http: Optional[httpx.AsyncClient] = None,
+        journal: Optional["TaskJournal"] = None,
+        resume: bool = False,
+        limiter: Optional[RateLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
         self.api_key = api_key
-        self.base_url = "https://api.dev.runwayml.com"
+        self.base_url = RUNWAY_API_URL
+        self._owns_http = http is None
+        self.http = http or create_http_client()
+        self.journal = journal
+        self.resume = resume
+        # max_inflight bounds concurrent Runway tasks, from submit to terminal status
+        self.limiter = limiter or RateLimiter(
+            "runway", RUNWAY_RPS, RUNWAY_BURST, RUNWAY_MAX_INFLIGHT
+        )
+        self.breaker = breaker or CircuitBreaker("runway")
+
+    async def aclose(self):
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http:
+            await self.http.aclose()
 
     async def generate_video(
         self,
         prompt: str,
         duration: int = 4,
-        ratio: str = "1280:720"
+        ratio: str = "1280:720",
+        job: Optional[dict] = None,
     ) -> dict:
         """Generate video from text prompt.
 
@@ -245,151 +1382,564 @@ class RunwayClient:
             prompt: Text description (up to 1000 chars)
             duration: 4, 6, or 8 seconds
             ratio: "1280:720", "720:1280", "1080:1920", "1920:1080"
+            job: Optional post_id/style/clip metadata for the task journal
 
         Returns:
             dict with task_id for polling status
         """
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/v1/text_to_video",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "X-Runway-Version": "2024-11-06",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "veo3.1_fast",  # Veo 3.1 Fast (quick generation)
-                    "promptText": prompt[:1000],
-                    "ratio": ratio,
-                    "duration": duration,
-                }
-            )
+        payload = {
+            "model": RUNWAY_TEXT_MODEL,
+            "promptText": prompt[:1000],
+            "ratio": ratio,
+            "duration": duration,
+        }
+        print("⏳ Waiting for video generation...")
+        status_data = await self._run_task("text_to_video", payload, job)
+        status = status_data.get('status')
+        if status == "error":
+            print(f"⚠️  Runway API error: {status_data['error']}")
+            return status_data
 
-            if response.status_code not in [200, 201]:
-                print(f"⚠️  Runway API error: {response.text}")
-                return {"status": "error", "error": response.text}
-
-            result = response.json()
-            task_id = result.get('id')
-            print(f"🎬 Runway task started: {task_id}")
-
-            # Poll for completion
-            print("⏳ Waiting for video generation...")
-            for attempt in range(60):  # Max 5 minutes
-                await asyncio.sleep(5)
-                status_response = await client.get(
-                    f"{self.base_url}/v1/tasks/{task_id}",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "X-Runway-Version": "2024-11-06",
-                    }
-                )
-                status_data = status_response.json()
-                status = status_data.get('status', 'UNKNOWN')
+        if status == 'SUCCEEDED':
+            print(f"✅ Video generated!")
+            return status_data
+        elif status in ('FAILED', 'REJECTED'):
+            print(f"❌ Generation failed: {status_data.get('error', 'Unknown error')}")
+            return {"status": "error", "error": status_data.get('error')}
+
+        return {"status": "error", "error": "Timeout waiting for video"}
 
-                if status == 'SUCCEEDED':
-                    print(f"✅ Video generated!")
+    async def _run_task(self, endpoint: str, payload: dict, job: Optional[dict], label: str = "Status") -> dict:
+        """Submit (or resume) a task and poll it to a final status.
+
+        Holds a concurrency slot from submit until the task finishes. A
+        resumed task that Runway rejects (expired or purged) is journaled
+        as REJECTED, which TaskJournal.find skips, and submitted afresh.
+
+        Returns:
+            Final task dict, or {"status": "error", ...} if the submit failed
+        """
+        async with self.limiter.slot():
+            while True:
+                task_id, resumed, error = await self._start_task(endpoint, payload, job)
+                if error:
+                    return error
+                status_data = await self.wait_for_task(task_id, label=label)
+                self._journal_result(task_id, status_data, job, payload)
+                if not (resumed and status_data.get("status") == "REJECTED"):
                     return status_data
-                elif status == 'FAILED':
-                    print(f"❌ Generation failed: {status_data.get('error', 'Unknown error')}")
-                    return {"status": "error", "error": status_data.get('error')}
-                elif status in ['PENDING', 'RUNNING']:
-                    print(f"   Status: {status} ({attempt * 5}s elapsed)")
-                else:
-                    print(f"   Status: {status}")
+                print(f"⚠️  Journaled task {task_id} is gone ({status_data['error']}), resubmitting")
 
-            return {"status": "error", "error": "Timeout waiting for video"}
+    @TRACER.traced("runway.submit")
+    async def _start_task(self, endpoint: str, payload: dict, job: Optional[dict]):
+        """Submit a task, or re-attach to a journaled one when resuming.
+
+        Returns:
+            (task_id, resumed, None) on success, (None, False, error dict) on failure
+        """
+        prompt_hash = TaskJournal.prompt_hash(payload)
+        TRACER.annotate(endpoint=endpoint)
+        if self.journal and job and self.resume:
+            entry = self.journal.find(job, prompt_hash)
+            if entry:
+                TRACER.annotate(resumed=True, task_id=entry["task_id"])
+                print(f"🔁 Resuming Runway task {entry['task_id']} ({entry['status']})")
+                return entry["task_id"], True, None
+
+        # A submit that reached Runway may have started a billed task, so
+        # only retry failures the server cannot have acted on
+        response = await send_with_retry(lambda: self.http.post(
+            f"{self.base_url}/v1/{endpoint}",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "X-Runway-Version": "2024-11-06",
+                "Content-Type": "application/json",
+            },
+            json=payload,
+        ), self.limiter, self.breaker, idempotent=False)
+
+        try:
+            task_id = response.json().get('id') if response.status_code in (200, 201) else None
+        except ValueError:
+            task_id = None
+        if not task_id:
+            return None, False, {"status": "error", "error": f"HTTP {response.status_code}: {response.text[:500]}"}
+
+        TRACER.annotate(task_id=task_id)
+        print(f"🎬 Runway {endpoint} task started: {task_id}")
+        if self.journal and job:
+            self.journal.record(job, prompt_hash, task_id, "SUBMITTED")
+        return task_id, False, None
+
+    def _journal_result(self, task_id: str, status_data: dict, job: Optional[dict], payload: dict):
+        if self.journal and job:
+            output = status_data.get("output") or [None]
+            self.journal.record(
+                job, TaskJournal.prompt_hash(payload), task_id,
+                status_data.get("status", "UNKNOWN"), output_url=output[0],
+            )
+
+    async def _fetch_task(self, task_id: str) -> httpx.Response:
+        return await send_with_retry(lambda: self.http.get(
+            f"{self.base_url}/v1/tasks/{task_id}",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "X-Runway-Version": "2024-11-06",
+            },
+            timeout=30.0,
+        ), self.limiter, self.breaker)
 
     async def get_task_status(self, task_id: str) -> dict:
         """Check status of video generation task."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.base_url}/v1/tasks/{task_id}",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "X-Runway-Version": "2024-11-06",
+        response = await self._fetch_task(task_id)
+        return response.json()
+
+    @TRACER.traced("runway.poll")
+    async def wait_for_task(
+        self,
+        task_id: str,
+        label: str = "Status",
+        deadline: float = RUNWAY_TASK_DEADLINE,
+        schedule: Optional[PollSchedule] = None,
+    ) -> dict:
+        """Poll a task until it SUCCEEDS, FAILS or the deadline passes.
+
+        Polls on an adaptive schedule and honours Retry-After from the
+        server (e.g. on 429). An open circuit breaker or a dropped connection
+        only delays the next poll, so a submitted task is never abandoned
+        before the deadline. Any other 4xx ends polling with status
+        "REJECTED". Time spent in each status is recorded under
+        the "timings" key of the returned task data.
+
+        Returns:
+            Final task dict; status is "TIMEOUT" if the deadline passed,
+            "REJECTED" (with the response in "error") on a 4xx
+        """
+        schedule = schedule or PollSchedule()
+        started = time.monotonic()
+        phase, phase_started = None, started
+        phases: dict = {}
+        status_data: dict = {}
+        attempt = 0
+
+        def record_phase(new_phase: Optional[str]):
+            nonlocal phase, phase_started
+            now = time.monotonic()
+            if phase is not None:
+                phases[phase] = phases.get(phase, 0.0) + now - phase_started
+            phase, phase_started = new_phase, now
+
+        server_hint = None
+
+        while True:
+            # Never poll sooner than the server asked us to
+            delay = max(schedule.delay(attempt), server_hint or 0.0)
+            if time.monotonic() - started + delay > deadline:
+                record_phase(None)
+                status_data = dict(status_data, status="TIMEOUT")
+                break
+
+            await asyncio.sleep(delay)
+            attempt += 1
+            try:
+                response = await self._fetch_task(task_id)
+            except ProviderUnavailable:
+                # The task is already submitted and billed: wait for the
+                # breaker's trial window instead of abandoning it
+                server_hint = self.breaker.retry_in()
+                continue
+            except httpx.TransportError:
+                # Polling is idempotent; keep trying until the deadline
+                server_hint = None
+                continue
+            server_hint = parse_retry_after(response.headers.get("Retry-After"))
+
+            if response.status_code == 429 or response.status_code >= 500:
+                # Rate limited or transient server error: back off and retry
+                continue
+
+            if response.status_code >= 400:
+                # Revoked key, unknown or purged task: polling won't fix it
+                record_phase(None)
+                status_data = {
+                    "status": "REJECTED",
+                    "error": f"HTTP {response.status_code}: {response.text[:500]}",
                 }
-            )
-            return response.json()
+                break
+
+            try:
+                status_data = response.json()
+            except ValueError:
+                # Not JSON (e.g. a proxy error page): treat as transient
+                continue
+            status = status_data.get('status', 'UNKNOWN')
+            if status in ('SUCCEEDED', 'FAILED'):
+                record_phase(None)
+                break
+            if status != phase:
+                record_phase(status)
+
+            elapsed = time.monotonic() - started
+            if status in ['PENDING', 'RUNNING']:
+                print(f"   {label}: {status} ({elapsed:.0f}s elapsed)")
+            else:
+                print(f"   {label}: {status}")
+
+        status_data["timings"] = {
+            "total": time.monotonic() - started,
+            "polls": attempt,
+            "phases": phases,
+        }
+        TRACER.annotate(task_id=task_id, status=status_data.get("status"), polls=attempt)
+        for phase_name, seconds in phases.items():
+            TRACER.record(f"runway.{phase_name.lower()}", seconds, task_id=task_id)
+        return status_data
+
+    async def image_to_video(
+        self,
+        image_path: str,
+        prompt: str,
+        duration: int = 10,
+        ratio: str = "1280:720",
+        job: Optional[dict] = None,
+    ) -> dict:
+        """Generate video from image (for chaining/extending).
+
+        Uses the last frame of a previous video to create smooth continuation.
+
+        Args:
+            image_path: Path to PNG/JPG image (or data URI)
+            prompt: Motion description
+            duration: 2-10 seconds
+            ratio: Aspect ratio
+            job: Optional post_id/style/clip metadata for the task journal
+
+        Returns:
+            dict with video URL
+        """
+        # Convert image to data URI if it's a file path
+        if image_path.startswith("data:"):
+            image_data = image_path
+        else:
+            with open(image_path, "rb") as f:
+                img_bytes = f.read()
+            ext = Path(image_path).suffix.lower()
+            mime = "image/png" if ext == ".png" else "image/jpeg"
+            b64 = base64.b64encode(img_bytes).decode()
+            image_data = f"data:{mime};base64,{b64}"
+
+        payload = {
+            "model": RUNWAY_IMAGE_MODEL,
+            "promptImage": image_data,
+            "position": "first",  # Use image as opening frame
+            "promptText": prompt[:1000],
+            "ratio": ratio,
+            "duration": min(duration, 10),  # Max 10s for image-to-video
+        }
+        status_data = await self._run_task("image_to_video", payload, job, label="Extending")
+        status = status_data.get('status')
+        if status == "error":
+            return status_data
+
+        if status == 'SUCCEEDED':
+            print(f"✅ Continuation clip generated!")
+            return status_data
+        elif status in ('FAILED', 'REJECTED'):
+            return {"status": "error", "error": status_data.get('error')}
+
+        return {"status": "error", "error": "Timeout"}
+
+
+# ========================================
+# Async ffmpeg Runner
+# ========================================
+
+class FFmpegError(Exception):
+    """An ffmpeg/ffprobe process exited with a non-zero status."""
+
+    def __init__(self, returncode: int, stderr: str):
+        super().__init__(f"exit {returncode}: {stderr[-500:]}")
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+FFMPEG_TIME_PATTERN = re.compile(r"time=(\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+async def run_process(
+    cmd: List[str],
+    on_stderr_line: Optional[Callable[[str], None]] = None,
+) -> bytes:
+    """Run a subprocess without blocking the event loop.
+
+    stderr is consumed incrementally (ffmpeg separates progress updates
+    with carriage returns) and each line is passed to `on_stderr_line`.
+    If the awaiting task is cancelled, the process is killed.
+
+    Returns:
+        stdout bytes
+
+    Raises:
+        FFmpegError: on a non-zero exit status
+        FileNotFoundError: if the executable isn't installed
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stderr_lines: List[str] = []
+
+    async def read_stderr():
+        buffer = b""
+        while True:
+            chunk = await proc.stderr.read(4096)
+            if not chunk:
+                break
+            buffer += chunk
+            parts = re.split(rb"[\r\n]", buffer)
+            buffer = parts.pop()
+            for part in parts:
+                if part.strip():
+                    line = part.decode(errors="replace")
+                    stderr_lines.append(line)
+                    if on_stderr_line:
+                        on_stderr_line(line)
+        if buffer.strip():
+            stderr_lines.append(buffer.decode(errors="replace"))
+
+    try:
+        stdout, _ = await asyncio.gather(proc.stdout.read(), read_stderr())
+        await proc.wait()
+    except asyncio.CancelledError:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    if proc.returncode != 0:
+        raise FFmpegError(proc.returncode, "\n".join(stderr_lines[-50:]))
+    return stdout
+
+
+class FFmpegPool:
+    """Runs ffmpeg jobs as async subprocesses, at most `workers` at a time.
+
+    Encodes are CPU-bound, so the pool defaults to one job per core; the
+    event loop stays free for Runway polls and downloads meanwhile.
+    """
+
+    def __init__(self, workers: int = FFMPEG_WORKERS):
+        self.workers = max(1, workers)
+        self._semaphore = asyncio.Semaphore(self.workers)
+
+    async def run(
+        self,
+        cmd: List[str],
+        duration: Optional[float] = None,
+        progress: Optional[Callable[[float], None]] = None,
+        op: str = "encode",
+    ) -> bytes:
+        """Run an ffmpeg command, reporting fractional progress if known.
+
+        `op` labels the job in traces (e.g. "merge", "frame", "render").
+        """
+        if cmd[0] == "ffmpeg" and "-nostdin" not in cmd:
+            cmd = [cmd[0], "-nostdin", *cmd[1:]]
+
+        def on_line(line: str):
+            match = FFMPEG_TIME_PATTERN.search(line)
+            if match and progress and duration:
+                h, m, sec = match.groups()
+                elapsed = int(h) * 3600 + int(m) * 60 + float(sec)
+                progress(min(1.0, elapsed / duration))
+
+        with TRACER.span("ffmpeg.queue", op=op):
+            await self._semaphore.acquire()
+        try:
+            with TRACER.span("ffmpeg", op=op):
+                return await run_process(cmd, on_line)
+        finally:
+            self._semaphore.release()
+
+
+# ========================================
+# Media Probe
+# ========================================
+
+_probe_cache: dict = {}
+
+
+@TRACER.traced("ffprobe")
+async def probe_media(path: Path) -> Optional[dict]:
+    """Probe a media file with ffprobe for duration, fps, codec and size.
+
+    Results are cached per (path, mtime, size), so repeated probes of the
+    same clip are free until the file changes.
+
+    Returns:
+        dict with duration, fps, codec, width, height, has_audio;
+        None if ffprobe is missing or the file can't be read
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if cache_key in _probe_cache:
+        TRACER.annotate(cached=True)
+        return _probe_cache[cache_key]
+
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-print_format", "json",
+        "-show_format", "-show_streams",
+        str(path),
+    ]
+    try:
+        data = json.loads(await run_process(cmd))
+    except (FFmpegError, FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    info = parse_probe(data)
+    _probe_cache[cache_key] = info
+    return info
+
+
+def parse_probe(data: dict) -> Optional[dict]:
+    """Reduce ffprobe JSON output to the fields the pipeline needs."""
+    streams = data.get("streams", [])
+    video = next((st for st in streams if st.get("codec_type") == "video"), None)
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), None)
+
+    duration = data.get("format", {}).get("duration") or (video or {}).get("duration")
+    if duration is None:
+        return None
+
+    fps = None
+    if video and video.get("avg_frame_rate", "0/0") != "0/0":
+        num, _, den = video["avg_frame_rate"].partition("/")
+        fps = float(num) / float(den or 1)
+
+    return {
+        "duration": float(duration),
+        "fps": fps,
+        "codec": video.get("codec_name") if video else None,
+        "width": video.get("width") if video else None,
+        "height": video.get("height") if video else None,
+        "has_audio": audio is not None,
+    }
+
+
+def encode_progress(label: str, step: float = 0.25) -> Callable[[float], None]:
+    """Progress callback that prints every `step` fraction of an encode."""
+    next_mark = [step]
+
+    def report(fraction: float):
+        while fraction >= next_mark[0] and next_mark[0] <= 1.0:
+            print(f"{label}: {next_mark[0]:.0%}")
+            next_mark[0] += step
+
+    return report
+
+
+def build_crossfade_filter(
+    durations: List[float],
+    crossfade: float = 0.5,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    fps: Optional[float] = None,
+) -> tuple:
+    """Build an xfade filter graph chaining N clips of known durations.
+
+    Each input is first normalized to the same size/fps/timebase (xfade
+    requires it). Clip i+1 starts fading in `crossfade` seconds before
+    the running output ends.
+
+    Returns:
+        (filter_complex, output label, total output duration)
+    """
+    filters = []
+    for i in range(len(durations)):
+        chain = []
+        if fps:
+            chain.append(f"fps={fps:.3f}")
+        if width and height:
+            chain.append(f"scale={width}:{height}")
+        chain += ["setsar=1", "format=yuv420p", "settb=AVTB"]
+        filters.append(f"[{i}:v]{','.join(chain)}[n{i}]")
+
+    label = "n0"
+    total = durations[0]
+    for i in range(1, len(durations)):
+        offset = max(0.0, total - crossfade)
+        out = f"x{i}"
+        filters.append(
+            f"[{label}][n{i}]xfade=transition=fade:duration={crossfade}:offset={offset:.3f}[{out}]"
+        )
+        label = out
+        total = offset + durations[i]
 
-    async def image_to_video(
-        self,
-        image_path: str,
-        prompt: str,
-        duration: int = 10,
-        ratio: str = "1280:720"
-    ) -> dict:
-        """Generate video from image (for chaining/extending).
+    return ";".join(filters), label, total
 
-        Uses the last frame of a previous video to create smooth continuation.
 
-        Args:
-            image_path: Path to PNG/JPG image (or data URI)
-            prompt: Motion description
-            duration: 2-10 seconds
-            ratio: Aspect ratio
+LOUDNORM_FILTER = "loudnorm=I=-16:TP=-1.5:LRA=11"  # LinkedIn/social loudness target
 
-        Returns:
-            dict with video URL
-        """
-        # Convert image to data URI if it's a file path
-        if image_path.startswith("data:"):
-            image_data = image_path
-        else:
-            with open(image_path, "rb") as f:
-                img_bytes = f.read()
-            ext = Path(image_path).suffix.lower()
-            mime = "image/png" if ext == ".png" else "image/jpeg"
-            b64 = base64.b64encode(img_bytes).decode()
-            image_data = f"data:{mime};base64,{b64}"
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/v1/image_to_video",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "X-Runway-Version": "2024-11-06",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "gen4_turbo",  # Better for image-to-video
-                    "promptImage": image_data,
-                    "position": "first",  # Use image as opening frame
-                    "promptText": prompt[:1000],
-                    "ratio": ratio,
-                    "duration": min(duration, 10),  # Max 10s for image-to-video
-                }
-            )
+def plan_final_render(
+    clip_paths: List[Path],
+    durations: List[float],
+    output_path: Path,
+    audio_path: Optional[Path] = None,
+    crossfade: float = 0.5,
+    loudnorm: bool = False,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    fps: Optional[float] = None,
+) -> tuple:
+    """Plan one ffmpeg command for crossfade + audio mux + loudness.
 
-            if response.status_code not in [200, 201]:
-                return {"status": "error", "error": response.text}
-
-            result = response.json()
-            task_id = result.get('id')
-            print(f"🎬 Image-to-video task started: {task_id}")
-
-            # Poll for completion
-            for attempt in range(60):
-                await asyncio.sleep(5)
-                status_response = await client.get(
-                    f"{self.base_url}/v1/tasks/{task_id}",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "X-Runway-Version": "2024-11-06",
-                    }
-                )
-                status_data = status_response.json()
-                status = status_data.get('status', 'UNKNOWN')
+    A single clip without a filter needs no video re-encode, so its
+    stream is copied; otherwise the crossfade graph is encoded once.
 
-                if status == 'SUCCEEDED':
-                    print(f"✅ Continuation clip generated!")
-                    return status_data
-                elif status == 'FAILED':
-                    return {"status": "error", "error": status_data.get('error')}
-                elif status in ['PENDING', 'RUNNING']:
-                    print(f"   Extending: {status} ({attempt * 5}s)")
+    Returns:
+        (ffmpeg command, expected output duration)
+    """
+    cmd = ["ffmpeg", "-y"]
+    for cp in clip_paths:
+        cmd.extend(["-i", str(cp)])
+    if audio_path:
+        cmd.extend(["-i", str(audio_path)])
+
+    filters = []
+    if len(clip_paths) > 1:
+        video_graph, video_label, total = build_crossfade_filter(
+            durations, crossfade, width=width, height=height, fps=fps
+        )
+        filters.append(video_graph)
+        video_map = f"[{video_label}]"
+        video_codec = ["-c:v", "libx264", "-preset", "fast", "-pix_fmt", "yuv420p"]
+    else:
+        total = durations[0]
+        video_map = "0:v:0"
+        video_codec = ["-c:v", "copy"]
+
+    audio_args = []
+    if audio_path:
+        audio_index = len(clip_paths)
+        if loudnorm:
+            filters.append(f"[{audio_index}:a]{LOUDNORM_FILTER}[a]")
+            audio_map = "[a]"
+        else:
+            audio_map = f"{audio_index}:a:0"
+        audio_args = ["-map", audio_map, "-c:a", "aac", "-shortest"]
 
-            return {"status": "error", "error": "Timeout"}
+    if filters:
+        cmd.extend(["-filter_complex", ";".join(filters)])
+    cmd.extend(["-map", video_map, *video_codec, *audio_args])
+    cmd.extend(["-movflags", "+faststart", str(output_path)])
+    return cmd, total
 
 
 # ========================================
@@ -399,15 +1949,47 @@ class RunwayClient:
 class LinkedInVideoGenerator:
     """Generates LinkedIn videos with Runway + Cartesia."""
 
-    def __init__(self):
-        self.runway = RunwayClient(RUNWAY_API_KEY) if RUNWAY_API_KEY else None
-        self.cartesia = CartesiaClient(CARTESIA_API_KEY) if CARTESIA_API_KEY else None
+    def __init__(
+        self,
+        http: Optional[httpx.AsyncClient] = None,
+        resume: bool = False,
+        reuse_renders: bool = False,
+        loudnorm: bool = False,
+    ):
+        # One pooled client shared by Runway, Cartesia and downloads
+        self._owns_http = http is None
+        self.http = http or create_http_client()
+        self.journal = TaskJournal()
+        self.runway = RunwayClient(
+            RUNWAY_API_KEY, http=self.http, journal=self.journal, resume=resume
+        ) if RUNWAY_API_KEY else None
+        self.audio_cache = AudioCache()
+        self.render_cache = RenderCache()
+        self.ffmpeg = FFmpegPool()
+        self.loudnorm = loudnorm
+        self.reuse_renders = reuse_renders
+        self._inflight_renders: dict = {}
+        self.cartesia = CartesiaClient(
+            CARTESIA_API_KEY, http=self.http, cache=self.audio_cache
+        ) if CARTESIA_API_KEY else None
 
         # Ensure output directories exist
         VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
         (VIDEOS_DIR / "audio").mkdir(exist_ok=True)
         (VIDEOS_DIR / "final").mkdir(exist_ok=True)
 
+    async def __aenter__(self) -> "LinkedInVideoGenerator":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the shared HTTP client if this generator created it."""
+        if self._owns_http:
+            await self.http.aclose()
+
+    @TRACER.traced("prompt")
     def generate_prompt(self, post: dict, style: str) -> str:
         """Generate Runway prompt from post content and style."""
         if style not in VIDEO_STYLES:
@@ -455,14 +2037,17 @@ class LinkedInVideoGenerator:
             raise ValueError("Cartesia API key not configured")
 
         print(f"🎤 Generating voice: {text[:50]}...")
-        audio_data = await self.cartesia.synthesize(text)
-
-        output_path.write_bytes(audio_data)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if CARTESIA_STREAMING:
+            await self.cartesia.synthesize_to_file(text, output_path)
+        else:
+            audio_data = await self.cartesia.synthesize(text)
+            output_path.write_bytes(audio_data)
         print(f"✅ Audio saved: {output_path}")
 
         return output_path
 
-    async def generate_video(self, prompt: str, output_path: Path) -> Path:
+    async def generate_video(self, prompt: str, output_path: Path, job: Optional[dict] = None) -> Path:
         """Generate video using Runway."""
         if not self.runway or not RUNWAY_API_KEY:
             # Demo mode - create placeholder
@@ -487,7 +2072,7 @@ Generated: {datetime.now().isoformat()}
 """)
             return output_path
 
-        result = await self.runway.generate_video(prompt)
+        result = await self.runway.generate_video(prompt, job=job)
 
         # Check for errors
         if result.get("status") == "error":
@@ -499,146 +2084,186 @@ Generated: {datetime.now().isoformat()}
         video_url = result.get("output", [None])[0]
         if video_url:
             print(f"📥 Downloading video from: {video_url[:50]}...")
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                video_response = await client.get(video_url)
-                if video_response.status_code == 200:
-                    # Change extension to .mp4
-                    output_path = output_path.with_suffix('.mp4')
-                    output_path.write_bytes(video_response.content)
-                    print(f"✅ Video saved: {output_path} ({len(video_response.content):,} bytes)")
-                else:
-                    print(f"⚠️  Failed to download video: {video_response.status_code}")
-                    output_path.write_text(f"Download failed\nURL: {video_url}")
+            # Change extension to .mp4
+            mp4_path = output_path.with_suffix('.mp4')
+            try:
+                size = await stream_download(
+                    self.http, video_url, mp4_path, progress=download_progress("   Downloading")
+                )
+                output_path = mp4_path
+                print(f"✅ Video saved: {output_path} ({size:,} bytes)")
+            except DownloadError as e:
+                print(f"⚠️  Failed to download video: {e}")
+                output_path.write_text(f"Download failed\nURL: {video_url}")
         else:
             print(f"⚠️  No video URL in response")
             output_path.write_text(f"No video URL\nResponse: {json.dumps(result, indent=2)}")
 
         return output_path
 
-    def merge_video_audio(self, video_path: Path, audio_path: Path, output_path: Path) -> Path:
-        """Merge video and audio using ffmpeg."""
-        cmd = [
-            "ffmpeg", "-y",
-            "-i", str(video_path),
-            "-i", str(audio_path),
-            "-c:v", "copy",
-            "-c:a", "aac",
-            "-map", "0:v:0",
-            "-map", "1:a:0",
-            "-shortest",
-            str(output_path)
-        ]
+    async def render_and_narrate(self, render: Awaitable, narrate: Optional[Awaitable] = None):
+        """Run a render and its narration side by side.
+
+        A narration failure never cancels the render, so a submitted Runway
+        task always runs to completion and its clip lands on disk. A render
+        failure is re-raised once both have finished.
+
+        Returns:
+            (render result, narration error or None)
+        """
+        if narrate is None:
+            return await render, None
+        rendered, narrated = await asyncio.gather(render, narrate, return_exceptions=True)
+        if isinstance(rendered, BaseException):
+            raise rendered
+        if isinstance(narrated, Exception):
+            print(f"⚠️  Narration failed, keeping the silent video: {narrated}")
+            return rendered, narrated
+        if isinstance(narrated, BaseException):
+            raise narrated
+        return rendered, None
+
+    async def merge_video_audio(self, video_path: Path, audio_path: Path, output_path: Path) -> Path:
+        """Merge video and audio using ffmpeg (video stream is copied, not re-encoded)."""
+        info = await probe_media(video_path)
+        cmd, total = plan_final_render(
+            [video_path],
+            [info["duration"] if info else 8.0],
+            output_path,
+            audio_path=audio_path,
+            loudnorm=self.loudnorm,
+        )
 
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
+            await self.ffmpeg.run(cmd, duration=total, op="merge")
             print(f"✅ Merged video+audio: {output_path}")
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  ffmpeg merge failed: {e.stderr.decode()}")
-            import shutil
+        except FFmpegError as e:
+            print(f"⚠️  ffmpeg merge failed: {e.stderr}")
             shutil.copy(video_path, output_path)
         except FileNotFoundError:
             print("⚠️  ffmpeg not found. Install with: brew install ffmpeg")
-            import shutil
             shutil.copy(video_path, output_path)
 
         return output_path
 
-    def extract_last_frame(self, video_path: Path) -> Path:
-        """Extract the last frame from a video for chaining."""
-        output_path = video_path.with_suffix('.png')
-
+    async def last_frame_data_uri(
+        self,
+        video_path: Union[Path, str],
+        ratio: str = "1280:720",
+        image_format: str = "jpeg",
+    ) -> Optional[str]:
+        """Grab a video's last frame straight into a data URI for chaining.
+
+        `video_path` may be a local file or an http(s) URL. ffmpeg pipes
+        the frame over stdout (no PNG round-trip on disk), scaled and
+        center-cropped to the target ratio; JPEG keeps the upload for each
+        continuation clip small.
+        """
+        width, height = ratio.split(":")
+        codec, mime = ("png", "image/png") if image_format == "png" else ("mjpeg", "image/jpeg")
         cmd = [
             "ffmpeg", "-y",
             "-sseof", "-0.5",  # Start 0.5s before end
             "-i", str(video_path),
             "-frames:v", "1",  # Just one frame
-            "-q:v", "2",  # High quality
-            str(output_path)
+            "-vf", f"scale={width}:{height}:force_original_aspect_ratio=increase,crop={width}:{height}",
+            "-q:v", "3",
+            "-f", "image2pipe", "-c:v", codec,
+            "pipe:1",
         ]
 
         try:
-            subprocess.run(cmd, check=True, capture_output=True)
-            print(f"📸 Extracted last frame: {output_path}")
-            return output_path
-        except Exception as e:
+            image_bytes = await self.ffmpeg.run(cmd, op="frame")
+        except (FFmpegError, FileNotFoundError) as e:
             print(f"⚠️  Frame extraction failed: {e}")
             return None
+        if not image_bytes:
+            print("⚠️  Frame extraction returned no data")
+            return None
+
+        print(f"📸 Grabbed last frame ({len(image_bytes):,} bytes {image_format})")
+        return f"data:{mime};base64,{base64.b64encode(image_bytes).decode()}"
 
-    def concat_videos_crossfade(
+    async def render_final(
         self,
-        video_paths: List[Path],
+        clip_paths: List[Path],
         output_path: Path,
-        crossfade_duration: float = 0.5
+        audio_path: Optional[Path] = None,
+        crossfade_duration: float = 0.5,
+        default_duration: float = 8.0,
     ) -> Path:
-        """Concatenate videos with crossfade transitions."""
-        if len(video_paths) == 1:
-            import shutil
-            shutil.copy(video_paths[0], output_path)
-            return output_path
+        """Render clips (+ optional narration) to `output_path` in one ffmpeg pass.
 
-        # Build ffmpeg filter for crossfade
-        # For 2 clips: [0:v][1:v]xfade=transition=fade:duration=0.5:offset=X[v]
-        filter_parts = []
-        current_offset = 0
-
-        for i in range(len(video_paths) - 1):
-            # Get video duration (approximate 8s per clip)
-            clip_duration = 8
-            offset = current_offset + clip_duration - crossfade_duration
+        Crossfades, the audio mux and optional loudness normalization are
+        planned as a single filter graph, so a voiced chained video is
+        encoded once and written straight to its final location.
+        """
+        infos = await asyncio.gather(*(probe_media(cp) for cp in clip_paths))
+        durations = [info["duration"] if info else default_duration for info in infos]
+        first = infos[0] or {}
+
+        cmd, total = plan_final_render(
+            clip_paths,
+            durations,
+            output_path,
+            audio_path=audio_path,
+            crossfade=crossfade_duration,
+            loudnorm=self.loudnorm,
+            width=first.get("width"),
+            height=first.get("height"),
+            fps=first.get("fps"),
+        )
 
-            if i == 0:
-                filter_parts.append(
-                    f"[0:v][1:v]xfade=transition=fade:duration={crossfade_duration}:offset={offset}[v{i}]"
-                )
-            else:
-                filter_parts.append(
-                    f"[v{i-1}][{i+1}:v]xfade=transition=fade:duration={crossfade_duration}:offset={offset}[v{i}]"
-                )
-            current_offset = offset
+        try:
+            await self.ffmpeg.run(cmd, duration=total, progress=encode_progress("   Encoding"), op="render")
+            print(f"✅ Rendered {len(clip_paths)} clip{'s' if len(clip_paths) > 1 else ''}"
+                  f"{' + narration' if audio_path else ''}: {output_path}")
+            return output_path
+        except FileNotFoundError:
+            print("⚠️  ffmpeg not found. Install with: brew install ffmpeg")
+        except FFmpegError as e:
+            print(f"⚠️  Render failed: {e.stderr[:200]}")
 
-        # Build command
-        cmd = ["ffmpeg", "-y"]
-        for vp in video_paths:
-            cmd.extend(["-i", str(vp)])
+        # Fallback: just use first video
+        shutil.copy(clip_paths[0], output_path)
+        return output_path
 
-        if len(video_paths) == 2:
-            filter_complex = f"[0:v][1:v]xfade=transition=fade:duration={crossfade_duration}:offset=7.5[v]"
-            cmd.extend(["-filter_complex", filter_complex, "-map", "[v]"])
-        else:
-            # For 3+ clips, use concat demuxer instead (simpler)
-            list_file = output_path.with_suffix('.txt')
-            with open(list_file, 'w') as f:
-                for vp in video_paths:
-                    f.write(f"file '{vp}'\n")
-            cmd = [
-                "ffmpeg", "-y", "-f", "concat", "-safe", "0",
-                "-i", str(list_file), "-c", "copy", str(output_path)
-            ]
-
-        cmd.extend(["-c:v", "libx264", "-preset", "fast", str(output_path)])
+    async def concat_videos_crossfade(
+        self,
+        video_paths: List[Path],
+        output_path: Path,
+        crossfade_duration: float = 0.5,
+        default_duration: float = 8.0,
+    ) -> Path:
+        """Concatenate any number of clips with crossfades in one ffmpeg pass.
 
-        try:
-            subprocess.run(cmd, check=True, capture_output=True)
-            print(f"✅ Videos concatenated with crossfade: {output_path}")
-            return output_path
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  Concat failed: {e.stderr.decode()[:200]}")
-            # Fallback: just use first video
-            import shutil
+        Transition offsets come from each clip's probed duration, so 4, 6,
+        8 and 10 second clips all fade at the right moment. If ffprobe is
+        unavailable, clips are assumed to be `default_duration` long.
+        """
+        if len(video_paths) == 1:
             shutil.copy(video_paths[0], output_path)
             return output_path
 
+        return await self.render_final(
+            video_paths, output_path,
+            crossfade_duration=crossfade_duration,
+            default_duration=default_duration,
+        )
+
     async def generate_chained_video(
         self,
         prompts: List[str],
         output_path: Path,
-        duration_per_clip: int = 8
+        duration_per_clip: int = 8,
+        job: Optional[dict] = None,
+        cache_key: Optional[str] = None,
     ) -> Path:
         """Generate a longer video by chaining multiple clips.
 
         Uses the Last Keyframe Method:
         1. Generate first clip with text-to-video
-        2. Extract last frame
+        2. Grab last frame (in memory, as a data URI)
         3. Generate continuation with image-to-video
         4. Repeat until all prompts used
         5. Concatenate with crossfade
@@ -647,6 +2272,9 @@ Generated: {datetime.now().isoformat()}
             prompts: List of prompts for each segment
             output_path: Final output path
             duration_per_clip: Duration per clip (max 8 for text, 10 for image)
+            job: Optional post_id/style metadata for the task journal
+            cache_key: Render cache key; the clips are cached only if the
+                whole chain rendered
 
         Returns:
             Path to final concatenated video
@@ -655,52 +2283,222 @@ Generated: {datetime.now().isoformat()}
             print("⚠️  Runway not configured for chaining")
             return output_path
 
-        clip_paths = []
-        temp_dir = VIDEOS_DIR / "temp"
-        temp_dir.mkdir(exist_ok=True)
+        work_dir = VIDEOS_DIR / "temp" / output_path.stem
+        if cache_key:
+            clip_paths = await self.render_chain_clips(cache_key, prompts, work_dir, duration_per_clip, job)
+        else:
+            clip_paths = await self.generate_chain_clips(prompts, work_dir, duration_per_clip, job)
 
-        print(f"\n🔗 Chaining {len(prompts)} clips for ~{len(prompts) * duration_per_clip}s video\n")
+        # Concatenate all clips
+        if clip_paths:
+            final = await self.concat_videos_crossfade(clip_paths, output_path)
+            shutil.rmtree(work_dir, ignore_errors=True)
+            return final
+        else:
+            print("⚠️  No clips generated")
+            return output_path
+
+    async def generate_chain_clips(
+        self,
+        prompts: List[str],
+        work_dir: Path,
+        duration_per_clip: int = 8,
+        job: Optional[dict] = None,
+    ) -> List[Path]:
+        """Generate and download the chained clips (steps 1-4) into work_dir.
+
+        Clips are pipelined: as soon as clip N's task succeeds its download
+        starts in the background, its last frame is grabbed straight from
+        the output URL, and clip N+1 is submitted without waiting for the
+        download. Each clip is probed as it lands so the final render can
+        start immediately. A download that has already failed stops the
+        chain before the next submit; one that fails after it is retried
+        once, since the clips after it are already paid for.
 
-        for i, prompt in enumerate(prompts):
-            print(f"\n📹 Generating clip {i+1}/{len(prompts)}...")
-            clip_path = temp_dir / f"clip_{i:02d}.mp4"
+        Returns:
+            Paths of the consecutive clips that were generated and downloaded
+        """
+        temp_dir = work_dir
+        temp_dir.mkdir(parents=True, exist_ok=True)
 
-            if i == 0:
-                # First clip: text-to-video
-                result = await self.runway.generate_video(prompt, duration=duration_per_clip)
-            else:
-                # Subsequent clips: image-to-video from last frame
-                last_frame = self.extract_last_frame(clip_paths[-1])
-                if last_frame and last_frame.exists():
+        print(f"\n🔗 Chaining {len(prompts)} clips for ~{len(prompts) * duration_per_clip}s video\n")
+
+        downloads: List[tuple] = []  # (video_url, clip_path, download task)
+        async with asyncio.TaskGroup() as group:
+            for i, prompt in enumerate(prompts):
+                print(f"\n📹 Generating clip {i+1}/{len(prompts)}...")
+                clip_job = dict(job, clip=i) if job else None
+
+                last_frame = None
+                if i > 0:
+                    # Subsequent clips: image-to-video from the previous last frame
+                    last_frame = await self.chain_frame(video_url, downloads[-1][2], clip_path)
+                    if any(task.done() and task.result() is None for _, _, task in downloads):
+                        print(f"   ⚠️  Stopping before clip {i+1}: an earlier clip failed to download")
+                        break
+                if last_frame:
                     result = await self.runway.image_to_video(
-                        str(last_frame), prompt, duration=min(duration_per_clip, 10)
+                        last_frame, prompt, duration=min(duration_per_clip, 10), job=clip_job
                     )
                 else:
-                    # Fallback to text-to-video
-                    result = await self.runway.generate_video(prompt, duration=duration_per_clip)
-
-            # Download and save clip
-            if result.get("status") != "error":
+                    # First clip, or fallback: text-to-video
+                    result = await self.runway.generate_video(prompt, duration=duration_per_clip, job=clip_job)
+
+                # Each clip continues from the previous one's last frame, so a
+                # missing clip ends the chain rather than being skipped
+                if result.get("status") == "error":
+                    print(f"   ⚠️  Clip {i+1} failed: {result.get('error', 'Unknown')}")
+                    break
                 video_url = result.get("output", [None])[0]
-                if video_url:
-                    async with httpx.AsyncClient(timeout=120.0) as client:
-                        video_response = await client.get(video_url)
-                        if video_response.status_code == 200:
-                            clip_path.write_bytes(video_response.content)
-                            clip_paths.append(clip_path)
-                            print(f"   ✅ Clip {i+1} saved")
-                        else:
-                            print(f"   ⚠️  Failed to download clip {i+1}")
-            else:
-                print(f"   ⚠️  Clip {i+1} failed: {result.get('error', 'Unknown')}")
+                if not video_url:
+                    print(f"   ⚠️  Clip {i+1} returned no video URL")
+                    break
 
-        # Concatenate all clips
-        if clip_paths:
-            return self.concat_videos_crossfade(clip_paths, output_path)
+                clip_path = temp_dir / f"clip_{i:02d}.mp4"
+                downloads.append(
+                    (video_url, clip_path, group.create_task(self.download_clip(video_url, clip_path, i)))
+                )
+
+        clip_paths = []
+        for i, (video_url, clip_path, download) in enumerate(downloads):
+            path = download.result() or await self.download_clip(video_url, clip_path, i)
+            if path is None:
+                break
+            clip_paths.append(path)
+
+        if len(clip_paths) < len(prompts):
+            print(f"⚠️  Chain stopped after {len(clip_paths)}/{len(prompts)} clips")
+        return clip_paths
+
+    async def download_clip(self, video_url: str, clip_path: Path, index: int) -> Optional[Path]:
+        """Download one chained clip and warm the probe cache for the render."""
+        try:
+            await stream_download(self.http, video_url, clip_path)
+        except DownloadError as e:
+            print(f"   ⚠️  Failed to download clip {index+1}: {e}")
+            return None
+        await probe_media(clip_path)
+        print(f"   ✅ Clip {index+1} saved")
+        return clip_path
+
+    async def chain_frame(self, video_url: str, download: asyncio.Task, clip_path: Path) -> Optional[str]:
+        """Last frame of a finished clip, without waiting for its download.
+
+        ffmpeg seeks the output URL with Range requests, so the next submit
+        overlaps the download; the local file is the fallback.
+        """
+        if not download.done():
+            frame = await self.last_frame_data_uri(video_url)
+            if frame:
+                return frame
+        if await download is None:
+            return None
+        return await self.last_frame_data_uri(clip_path)
+
+    def chain_prompts(self, post: dict, prompt: str, chain_clips: int, duration: int) -> List[str]:
+        """Prompts for each clip: the style prompt, then continuations."""
+        # Generate multiple prompts for chaining
+        chain_prompts = [prompt]
+        # Add continuation prompts
+        for i in range(1, chain_clips):
+            continuation = f"Continue smoothly: {post['key_phrase']}. Same visual style, same lighting. Slow camera movement. {duration} seconds."
+            chain_prompts.append(continuation)
+        return chain_prompts
+
+    def render_key(self, chain_prompts: List[str], duration: int) -> str:
+        return RenderCache.key(
+            prompts=chain_prompts,
+            duration=duration,
+            text_model=RUNWAY_TEXT_MODEL,
+            image_model=RUNWAY_IMAGE_MODEL,
+        )
+
+    def cached_render(self, key: str) -> Optional[List[Path]]:
+        """Previously rendered clip(s) for this key, if reuse is enabled."""
+        if not self.reuse_renders:
+            return None
+        cached = self.render_cache.get(key)
+        if cached:
+            print(f"♻️  Reusing cached render: {key[:12]} ({len(cached)} clip{'s' if len(cached) > 1 else ''})")
+        return cached
+
+    async def render_chain_clips(
+        self,
+        key: str,
+        prompts: List[str],
+        work_dir: Path,
+        duration: int,
+        job: Optional[dict] = None,
+    ) -> List[Path]:
+        """Generate a chain's clips and cache them under its render key.
+
+        Only a complete chain is cached, so a reused render is never shorter
+        than the one asked for.
+        """
+        clip_paths = await self.generate_chain_clips(prompts, work_dir, duration, job)
+        if len(clip_paths) == len(prompts):
+            await asyncio.to_thread(self.render_cache.put_clips, key, clip_paths)
+        return clip_paths
+
+    async def render_raw_video(
+        self,
+        post: dict,
+        prompt: str,
+        video_raw_path: Path,
+        chain_clips: int = 1,
+        duration: int = 8,
+        style: Optional[str] = None,
+    ) -> Path:
+        """Render the raw (silent) Runway clip for a post, single or chained.
+
+        Renders are keyed on their prompts and model parameters: concurrent
+        jobs asking for the same render share one in-flight task, and with
+        reuse_renders a previously cached clip is copied instead of paying
+        for a new render.
+        """
+        chain_prompts = self.chain_prompts(post, prompt, chain_clips, duration)
+        key = self.render_key(chain_prompts, duration)
+
+        cached = self.cached_render(key)
+        if cached:
+            return await self.concat_videos_crossfade(cached, video_raw_path)
+
+        inflight = self._inflight_renders.get(key)
+        if inflight:
+            print("🔗 Same render already in flight, waiting on it...")
+            rendered = await inflight
+            if isinstance(rendered, list):
+                # A single-pass chain: its work dir is temporary, so use the
+                # copies it cached under the same key
+                clips = self.render_cache.get(key)
+                if clips:
+                    return await self.concat_videos_crossfade(clips, video_raw_path)
+                print("⚠️  No clips generated")
+            elif rendered != video_raw_path and rendered.exists():
+                shutil.copy(rendered, video_raw_path)
+            return video_raw_path
+
+        job = {"post_id": post["id"], "style": style}
+        if chain_clips > 1:
+            # Cached as clips by render_chain_clips, and only when complete
+            render = self.generate_chained_video(
+                chain_prompts, video_raw_path, duration_per_clip=duration, job=job, cache_key=key
+            )
         else:
-            print("⚠️  No clips generated")
-            return output_path
+            render = self.generate_video(prompt, video_raw_path, job=job)
+
+        task = asyncio.ensure_future(render)
+        self._inflight_renders[key] = task
+        try:
+            rendered = await task
+        finally:
+            self._inflight_renders.pop(key, None)
 
+        if chain_clips == 1 and is_video_file(rendered):
+            await asyncio.to_thread(self.render_cache.put, key, rendered)
+        return rendered
+
+    @TRACER.traced("generate")
     async def generate(
         self,
         post_id: str,
@@ -722,6 +2520,7 @@ Generated: {datetime.now().isoformat()}
             dict with paths and metadata
         """
         total_duration = chain_clips * duration
+        TRACER.annotate(post_id=post_id, style=style, voice=with_voice, clips=chain_clips)
         print(f"\n{'='*50}")
         print(f"🎬 Generating video for {post_id}")
         print(f"   Style: {style}")
@@ -744,38 +2543,67 @@ Generated: {datetime.now().isoformat()}
         video_raw_path = VIDEOS_DIR / f"{base_name}_raw.mp4"
         audio_path = VIDEOS_DIR / "audio" / f"{base_name}.wav"
 
-        suffix = "_voice" if with_voice else "_silent"
-        final_path = VIDEOS_DIR / "final" / f"{base_name}{suffix}.mp4"
+        silent_path = VIDEOS_DIR / "final" / f"{base_name}_silent.mp4"
+        final_path = VIDEOS_DIR / "final" / f"{base_name}_voice.mp4" if with_voice else silent_path
 
-        # Generate video (single or chained)
-        if chain_clips > 1:
-            # Generate multiple prompts for chaining
-            chain_prompts = [prompt]
-            # Add continuation prompts
-            for i in range(1, chain_clips):
-                continuation = f"Continue smoothly: {post['key_phrase']}. Same visual style, same lighting. Slow camera movement. {duration} seconds."
-                chain_prompts.append(continuation)
-
-            await self.generate_chained_video(chain_prompts, video_raw_path, duration_per_clip=duration)
-        else:
-            await self.generate_video(prompt, video_raw_path)
-
-        # Generate voice if requested
-        if with_voice:
-            if self.cartesia and CARTESIA_API_KEY:
-                voice_script = self.get_voice_script(post, style)
-                await self.generate_voice(voice_script, audio_path)
-                self.merge_video_audio(video_raw_path, audio_path, final_path)
+        has_voice = with_voice and bool(self.cartesia and CARTESIA_API_KEY)
+        chain_prompts = self.chain_prompts(post, prompt, chain_clips, duration)
+        render_key = self.render_key(chain_prompts, duration)
+        single_pass = (
+            has_voice and chain_clips > 1 and self.runway is not None
+            and render_key not in self._inflight_renders
+            and not (self.reuse_renders and self.render_cache.has(render_key))
+        )
+
+        if single_pass:
+            # Voiced chained video: crossfade + audio mux (+ loudnorm) in one
+            # encode straight to final/, with no _raw.mp4 intermediate
+            work_dir = VIDEOS_DIR / "temp" / base_name
+            chain = asyncio.ensure_future(self.render_chain_clips(
+                render_key, chain_prompts, work_dir, duration,
+                job={"post_id": post["id"], "style": style},
+            ))
+            # Concurrent jobs asking for the same render wait on this one
+            self._inflight_renders[render_key] = chain
+            try:
+                clip_paths, voice_error = await self.render_and_narrate(
+                    chain, self.generate_voice(self.get_voice_script(post, style), audio_path),
+                )
+            finally:
+                self._inflight_renders.pop(render_key, None)
+            TRACER.annotate(single_pass=True)
+            if voice_error:
+                final_path = silent_path
+            if clip_paths:
+                await self.render_final(
+                    clip_paths, final_path, audio_path=None if voice_error else audio_path
+                )
             else:
+                print("⚠️  No clips generated")
+            shutil.rmtree(work_dir, ignore_errors=True)
+        else:
+            # Generate video (single or chained); the narration depends only on
+            # the post, so synthesize it concurrently behind the Runway poll
+            _, voice_error = await self.render_and_narrate(
+                self.render_raw_video(post, prompt, video_raw_path, chain_clips, duration, style),
+                self.generate_voice(self.get_voice_script(post, style), audio_path) if has_voice else None,
+            )
+
+            # Merge once both video and audio are ready
+            if voice_error:
+                final_path = silent_path
+                shutil.copy(video_raw_path, final_path)
+                print(f"✅ Silent video saved: {final_path}")
+            elif has_voice:
+                await self.merge_video_audio(video_raw_path, audio_path, final_path)
+            elif with_voice:
                 print("⚠️  DEMO MODE: Cartesia API key not configured")
                 print(f"   Would generate voice for: \"{self.get_voice_script(post, style)[:60]}...\"")
-                import shutil
                 shutil.copy(video_raw_path, final_path)
-        else:
-            # Just copy video to final location
-            import shutil
-            shutil.copy(video_raw_path, final_path)
-            print(f"✅ Video saved: {final_path}")
+            else:
+                # Just copy video to final location
+                shutil.copy(video_raw_path, final_path)
+                print(f"✅ Video saved: {final_path}")
 
         result = {
             "post_id": post_id,
@@ -786,6 +2614,8 @@ Generated: {datetime.now().isoformat()}
             "timestamp": timestamp,
             "cost_estimate": 2.50 if style == "pain-point" else 1.75,
         }
+        if voice_error:
+            result["voice_error"] = str(voice_error)
 
         print(f"\n✅ Generation complete!")
         print(f"   📁 Output: {final_path}")
@@ -793,6 +2623,83 @@ Generated: {datetime.now().isoformat()}
 
         return result
 
+    @TRACER.traced("generate_ab")
+    async def generate_ab(
+        self,
+        post_id: str,
+        style: str,
+        chain_clips: int = 1,
+        duration: int = 8,
+    ) -> dict:
+        """Generate voice and silent A/B variants from one shared Runway render.
+
+        The two variants differ only in the audio track, so the video is
+        rendered once while Cartesia synthesizes the narration in parallel.
+
+        Returns:
+            dict with voice_path, silent_path and metadata
+        """
+        total_duration = chain_clips * duration
+        TRACER.annotate(post_id=post_id, style=style, clips=chain_clips)
+        print(f"\n{'='*50}")
+        print(f"🧪 Generating A/B videos for {post_id}")
+        print(f"   Style: {style}")
+        print(f"   Duration: ~{total_duration}s ({chain_clips} clip{'s' if chain_clips > 1 else ''} × {duration}s)")
+        print(f"{'='*50}\n")
+
+        post = read_post(post_id)
+        print(f"📝 Post content: {post['key_phrase'][:60]}...")
+
+        prompt = self.generate_prompt(post, style)
+        print(f"\n🎯 Runway prompt:\n{prompt}\n")
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_name = f"{post_id}_{style}_{timestamp}"
+
+        video_raw_path = VIDEOS_DIR / f"{base_name}_raw.mp4"
+        audio_path = VIDEOS_DIR / "audio" / f"{base_name}.wav"
+        voice_path = VIDEOS_DIR / "final" / f"{base_name}_voice.mp4"
+        silent_path = VIDEOS_DIR / "final" / f"{base_name}_silent.mp4"
+
+        voice_script = self.get_voice_script(post, style)
+        has_voice = bool(self.cartesia and CARTESIA_API_KEY)
+
+        # TTS runs while Runway renders/polls
+        _, voice_error = await self.render_and_narrate(
+            self.render_raw_video(post, prompt, video_raw_path, chain_clips, duration, style),
+            self.generate_voice(voice_script, audio_path) if has_voice else None,
+        )
+
+        shutil.copy(video_raw_path, silent_path)
+        print(f"✅ Silent version saved: {silent_path}")
+
+        if voice_error:
+            # Keep the silent variant; the voice variant needs a rerun
+            voice_path = None
+        elif has_voice:
+            await self.merge_video_audio(video_raw_path, audio_path, voice_path)
+        else:
+            print("⚠️  DEMO MODE: Cartesia API key not configured")
+            print(f"   Would generate voice for: \"{voice_script[:60]}...\"")
+            shutil.copy(video_raw_path, voice_path)
+
+        result = {
+            "post_id": post_id,
+            "style": style,
+            "voice_path": str(voice_path) if voice_path else None,
+            "silent_path": str(silent_path),
+            "prompt": prompt,
+            "timestamp": timestamp,
+            "cost_estimate": 2.50 if style == "pain-point" else 1.75,
+        }
+        if voice_error:
+            result["voice_error"] = str(voice_error)
+
+        print(f"\n✅ A/B generation complete!")
+        print(f"   💰 Est. cost: ${result['cost_estimate']:.2f} (one shared render)")
+
+        return result
+
 
 # ========================================
 # CLI Interface
@@ -815,7 +2722,10 @@ async def list_voices():
         return
 
     client = CartesiaClient(CARTESIA_API_KEY)
-    voices = await client.list_voices()
+    try:
+        voices = await client.list_voices()
+    finally:
+        await client.aclose()
 
     print(f"\n🎤 Available Voices ({len(voices)} total):\n")
     for voice in voices[:10]:  # Show first 10
@@ -825,6 +2735,148 @@ async def list_voices():
         print()
 
 
+# ========================================
+# Batch Mode
+# ========================================
+
+def resolve_batch_posts(items: List[str]) -> List[str]:
+    """Expand batch arguments into a de-duplicated list of post IDs.
+
+    Each item is either a post ID (EC-001) or a schedule.json week key
+    (week1, default), which expands to every post scheduled that week.
+    Weeks are resolved by the shared post index, the same way post.py does.
+    """
+    index = get_post_index()
+    post_ids = []
+    for item in items:
+        slots = index.schedule_view(week=item)
+        if not slots:
+            post_ids.append(item.upper())
+            continue
+        for slot in slots:
+            if slot.record:
+                post_ids.append(slot.record.post_id)
+            else:
+                print(f"⚠️  {slot.week}/{slot.day}: {slot.path} not found, skipping")
+
+    # Keep first occurrence order, drop duplicates
+    return list(dict.fromkeys(post_ids))
+
+
+def placeholder_reason(path: Path) -> str:
+    """First line of the placeholder written in place of a failed video."""
+    try:
+        with open(path, errors="replace") as f:
+            return f.readline().strip() or "no video produced"
+    except OSError:
+        return "no video produced"
+
+
+async def run_batch(
+    generator: "LinkedInVideoGenerator",
+    post_ids: List[str],
+    styles: List[str],
+    with_voice: bool = False,
+    max_parallel: int = 3,
+    chain_clips: int = 1,
+    duration: int = 8,
+) -> List[dict]:
+    """Generate videos for every post × style with bounded concurrency.
+
+    Jobs run in an asyncio task group; a semaphore caps how many are in
+    flight at once so we stay within the provider's concurrency limit.
+    A failing job is recorded in the summary instead of cancelling the batch.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+    jobs = [(post_id, style) for post_id in post_ids for style in styles]
+    results: List[dict] = [None] * len(jobs)
+
+    async def run_job(index: int, post_id: str, style: str):
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                result = await generator.generate(
+                    post_id, style, with_voice=with_voice,
+                    chain_clips=chain_clips, duration=duration
+                )
+                # Failed renders are written as text placeholders, not raised
+                video_path = Path(result["video_path"])
+                if is_video_file(video_path):
+                    result["status"] = "ok"
+                else:
+                    result["status"] = "error"
+                    result["error"] = placeholder_reason(video_path)
+            except Exception as e:
+                print(f"❌ {post_id} / {style} failed: {e}")
+                result = {
+                    "post_id": post_id,
+                    "style": style,
+                    "with_voice": with_voice,
+                    "status": "error",
+                    "error": str(e),
+                }
+            result["elapsed"] = time.monotonic() - started
+            results[index] = result
+
+    print(f"📦 Batch: {len(jobs)} job{'s' if len(jobs) != 1 else ''} "
+          f"({len(post_ids)} posts × {len(styles)} styles), max {max_parallel} in parallel\n")
+
+    async with asyncio.TaskGroup() as group:
+        for index, (post_id, style) in enumerate(jobs):
+            group.create_task(run_job(index, post_id, style))
+
+    return results
+
+
+def print_batch_summary(results: List[dict], wall_clock: float):
+    """Print a per-job summary table for a batch run."""
+    print("\n" + "="*50)
+    print("📦 BATCH SUMMARY")
+    print("="*50 + "\n")
+    print(f"  {'Post':<10} {'Style':<14} {'Voice':<6} {'Status':<7} {'Time':>7}  Output")
+    print(f"  {'-'*10} {'-'*14} {'-'*6} {'-'*7} {'-'*7}  {'-'*20}")
+    for r in results:
+        if r["status"] == "ok":
+            output = Path(r["video_path"]).name
+        else:
+            output = r.get("error", "")
+        status = "✅ ok" if r["status"] == "ok" else "❌ err"
+        print(f"  {r['post_id']:<10} {r['style']:<14} {'yes' if r['with_voice'] else 'no':<6} "
+              f"{status:<7} {r['elapsed']:>6.1f}s  {output[:60]}")
+
+    succeeded = sum(1 for r in results if r["status"] == "ok")
+    total_cost = sum(r.get("cost_estimate", 0) for r in results if r["status"] == "ok")
+    print(f"\n  {succeeded}/{len(results)} succeeded in {wall_clock:.1f}s")
+    print(f"  💰 Est. cost: ${total_cost:.2f}")
+
+
+def print_cache_stats(generator: "LinkedInVideoGenerator"):
+    """Print cache hit/miss stats if any cache was consulted."""
+    audio = generator.audio_cache.stats()
+    if audio["hits"] + audio["misses"]:
+        print(f"\n♻️  Audio cache: {audio['hits']} hits, {audio['misses']} misses, "
+              f"{audio['evictions']} evicted ({audio['hit_rate']:.0%} hit rate)")
+    renders = generator.render_cache
+    if renders.hits or renders.evictions:
+        print(f"♻️  Render cache: {renders.hits} reused, {renders.misses} rendered, "
+              f"{renders.evictions} evicted")
+
+
+def print_limiter_stats(generator: "LinkedInVideoGenerator"):
+    """Print rate limiter queueing and breaker trips for each provider."""
+    for client in (generator.runway, generator.cartesia):
+        if client is None:
+            continue
+        st = client.limiter.stats()
+        if st["total_wait"] > 0.01 or st["throttled"]:
+            print(f"🚦 {client.limiter.name}: peak {st['peak_in_flight']} in flight, "
+                  f"peak queue {st['peak_waiting']}, {st['total_wait']:.1f}s queued, "
+                  f"{st['throttled']} × 429")
+        if client.breaker.trips:
+            print(f"🔌 {client.breaker.name}: circuit opened {client.breaker.trips}× "
+                  f"(now {client.breaker.state})")
+
+
 async def main():
     parser = argparse.ArgumentParser(
         description="Generate LinkedIn videos with Runway + Cartesia"
@@ -875,9 +2927,62 @@ async def main():
         choices=[4, 6, 8],
         help="Duration per clip in seconds (default: 8)"
     )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        metavar="POST_OR_WEEK",
+        help="Generate many posts: post IDs and/or schedule.json weeks (e.g., week1)"
+    )
+    parser.add_argument(
+        "--styles",
+        nargs="+",
+        choices=list(VIDEO_STYLES.keys()),
+        help="Styles to render for each post in --batch (default: --style)"
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Max concurrent jobs in --batch mode (default: 3)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Re-attach to journaled Runway tasks instead of resubmitting them"
+    )
+    parser.add_argument(
+        "--reuse-renders",
+        action="store_true",
+        help="Reuse a cached raw clip when the same prompt/model/duration was rendered before"
+    )
+    parser.add_argument(
+        "--loudnorm",
+        action="store_true",
+        help="Normalize narration loudness (EBU R128, -16 LUFS) in the final render"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-stage timing breakdown at the end"
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="Append stage spans to FILE as JSON lines (default: $TRACE_FILE)"
+    )
+    parser.add_argument(
+        "--otel",
+        action="store_true",
+        help="Also emit spans through OpenTelemetry (requires opentelemetry-sdk)"
+    )
 
     args = parser.parse_args()
 
+    if args.trace or args.otel:
+        TRACER.configure(args.trace or TRACER.jsonl_path, otel=args.otel)
+
     # Handle list commands
     if args.list_styles:
         list_styles()
@@ -887,46 +2992,67 @@ async def main():
         await list_voices()
         return
 
+    if args.batch:
+        styles = args.styles or ([args.style] if args.style else None)
+        if not styles:
+            parser.error("--style or --styles is required for --batch")
+
+        post_ids = resolve_batch_posts(args.batch)
+        with_voice = args.voice and not args.no_voice
+        started = time.monotonic()
+        async with LinkedInVideoGenerator(
+            resume=args.resume, reuse_renders=args.reuse_renders, loudnorm=args.loudnorm
+        ) as generator:
+            results = await run_batch(
+                generator, post_ids, styles, with_voice=with_voice,
+                max_parallel=args.max_parallel,
+                chain_clips=args.chain, duration=args.duration
+            )
+        print_batch_summary(results, time.monotonic() - started)
+        print_cache_stats(generator)
+        print_limiter_stats(generator)
+        if args.profile:
+            TRACER.print_profile()
+        return
+
     # Validate required args for generation
     if not args.post:
         parser.error("--post is required for video generation")
     if not args.style:
         parser.error("--style is required for video generation")
 
-    # Generate video(s)
-    generator = LinkedInVideoGenerator()
-
-    if args.both:
-        # Generate both versions for A/B testing
-        print("🧪 A/B Test Mode: Generating both voice and silent versions\n")
-
-        # Version A: With voice
-        result_voice = await generator.generate(
-            args.post, args.style, with_voice=True,
-            chain_clips=args.chain, duration=args.duration
-        )
+    # Generate video(s) over one pooled HTTP connection
+    async with LinkedInVideoGenerator(
+        resume=args.resume, reuse_renders=args.reuse_renders, loudnorm=args.loudnorm
+    ) as generator:
+        if args.both:
+            # Generate both versions for A/B testing from one render
+            print("🧪 A/B Test Mode: Generating both voice and silent versions\n")
+
+            result = await generator.generate_ab(
+                args.post, args.style,
+                chain_clips=args.chain, duration=args.duration
+            )
 
-        # Version B: Without voice
-        result_silent = await generator.generate(
-            args.post, args.style, with_voice=False,
-            chain_clips=args.chain, duration=args.duration
-        )
+            print("\n" + "="*50)
+            print("🧪 A/B TEST VIDEOS READY")
+            print("="*50)
+            print(f"\n📹 Version A (Voice):  {result['voice_path'] or '❌ ' + result['voice_error']}")
+            print(f"📹 Version B (Silent): {result['silent_path']}")
+            print(f"\n💡 Tip: Post Version A on Monday, Version B on Wednesday")
+            print(f"   Compare: engagement rate, comments, DMs")
 
-        print("\n" + "="*50)
-        print("🧪 A/B TEST VIDEOS READY")
-        print("="*50)
-        print(f"\n📹 Version A (Voice):  {result_voice['video_path']}")
-        print(f"📹 Version B (Silent): {result_silent['video_path']}")
-        print(f"\n💡 Tip: Post Version A on Monday, Version B on Wednesday")
-        print(f"   Compare: engagement rate, comments, DMs")
+        else:
+            # Single version
+            with_voice = args.voice and not args.no_voice
+            await generator.generate(
+                args.post, args.style, with_voice=with_voice,
+                chain_clips=args.chain, duration=args.duration
+            )
 
-    else:
-        # Single version
-        with_voice = args.voice and not args.no_voice
-        await generator.generate(
-            args.post, args.style, with_voice=with_voice,
-            chain_clips=args.chain, duration=args.duration
-        )
+    print_cache_stats(generator)
+    if args.profile:
+        TRACER.print_profile()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Local Runway + Cartesia Stand-in Server
+
+Implements the slice of the Runway and Cartesia APIs that
+generate_video.py uses, so the whole pipeline (batch concurrency,
+polling, downloads, ffmpeg) can run offline, for free, and reproducibly.
+
+Endpoints:
+    POST /v1/text_to_video      Runway: start a render task
+    POST /v1/image_to_video     Runway: start a continuation task
+    GET  /v1/tasks/{id}         Runway: task status (PENDING → RUNNING → SUCCEEDED)
+    GET  /assets/{id}.mp4       Rendered clip (supports Range requests)
+    POST /tts/bytes             Cartesia: synthesize a WAV
+    POST /tts/sse               Cartesia: stream raw PCM chunks as server-sent events
+    GET  /voices                Cartesia: list voices
+
+Usage:
+    python scripts/mock_api.py --port 8765 --render-time 3 --queue-depth 4
+
+    # In another shell, point the generator at it:
+    export RUNWAY_API_URL=http://127.0.0.1:8765 CARTESIA_API_URL=http://127.0.0.1:8765
+    export RUNWAY_API_KEY=mock CARTESIA_API_KEY=mock
+    python scripts/generate_video.py --batch week1 --style abstract --voice
+"""
+
+import io
+import json
+import base64
+import math
+import random
+import argparse
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+import wave
+from array import array
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+
+# ========================================
+# Synthetic Assets
+# ========================================
+
+def make_pcm(seconds: float, sample_rate: int = 44100, freq: float = 220.0) -> bytes:
+    """Generate mono 16-bit little-endian sine-tone samples."""
+    frames = int(seconds * sample_rate)
+    return array("h", (
+        int(8000 * math.sin(2 * math.pi * freq * i / sample_rate)) for i in range(frames)
+    )).tobytes()
+
+
+def make_wav(seconds: float, sample_rate: int = 44100, freq: float = 220.0) -> bytes:
+    """Generate a mono 16-bit sine-tone WAV."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(make_pcm(seconds, sample_rate, freq))
+    return buffer.getvalue()
+
+
+def make_mp4(seconds: int, size: str = "1280x720", fps: int = 24) -> bytes:
+    """Generate a small H.264 test-pattern MP4 with ffmpeg.
+
+    Falls back to a bare MP4 header if ffmpeg isn't installed, which is
+    enough for download/poll benchmarks but not for ffmpeg stages.
+    """
+    if shutil.which("ffmpeg"):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "clip.mp4"
+            cmd = [
+                "ffmpeg", "-nostdin", "-y", "-loglevel", "error",
+                "-f", "lavfi", "-i", f"testsrc2=size={size}:rate={fps}:duration={seconds}",
+                "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p",
+                "-movflags", "+faststart", str(out),
+            ]
+            subprocess.run(cmd, check=True)
+            return out.read_bytes()
+
+    print("⚠️  ffmpeg not found: serving placeholder MP4 bytes (ffmpeg stages will fail)")
+    ftyp = struct.pack(">I", 24) + b"ftypisom" + struct.pack(">I", 512) + b"isommp41"
+    return ftyp + b"\0" * (64 * 1024)
+
+
+# ========================================
+# Mock State
+# ========================================
+
+class MockState:
+    """Task bookkeeping and fault injection shared by all handler threads."""
+
+    def __init__(
+        self,
+        render_time: float = 3.0,
+        queue_depth: int = 4,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        task_failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.render_time = render_time
+        self.queue_depth = queue_depth
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.task_failure_rate = task_failure_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.tasks: dict = {}
+        self.requests: dict = {}
+        self._assets: dict = {}
+
+    def count(self, endpoint: str):
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+
+    def asset(self, duration: int) -> bytes:
+        """Synthetic MP4 for a clip duration (generated once, then reused)."""
+        with self.lock:
+            if duration not in self._assets:
+                self._assets[duration] = make_mp4(duration)
+            return self._assets[duration]
+
+    def fault(self) -> Optional[int]:
+        """Injected status code for this request, if any."""
+        roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 503
+        return None
+
+    def create_task(self, duration: int) -> str:
+        task_id = str(uuid.uuid4())
+        with self.lock:
+            self.tasks[task_id] = {
+                "id": task_id,
+                "created": time.monotonic(),
+                "started": None,
+                "duration": duration,
+                "fails": self.random.random() < self.task_failure_rate,
+            }
+        return task_id
+
+    def task_status(self, task_id: str) -> Optional[dict]:
+        """Advance the queue and return the task's current status."""
+        now = time.monotonic()
+        with self.lock:
+            task = self.tasks.get(task_id)
+            if task is None:
+                return None
+
+            # Promote queued tasks in submit order while slots are free
+            running = [t for t in self.tasks.values()
+                       if t["started"] is not None and now - t["started"] < self.render_time]
+            queued = sorted((t for t in self.tasks.values() if t["started"] is None),
+                            key=lambda t: t["created"])
+            for t in queued[:max(0, self.queue_depth - len(running))]:
+                t["started"] = now
+
+            if task["started"] is None:
+                return {"id": task_id, "status": "PENDING"}
+            if now - task["started"] < self.render_time:
+                progress = (now - task["started"]) / self.render_time
+                return {"id": task_id, "status": "RUNNING", "progress": round(progress, 2)}
+            if task["fails"]:
+                return {"id": task_id, "status": "FAILED", "error": "Mock render failure"}
+            return {"id": task_id, "status": "SUCCEEDED"}
+
+
+# ========================================
+# HTTP Handler
+# ========================================
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Routes Runway/Cartesia requests against the server's MockState."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "MockRunwayCartesia/1.0"
+
+    @property
+    def state(self) -> MockState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, code: int, payload, headers: Optional[dict] = None):
+        body = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except json.JSONDecodeError:
+            return {}
+
+    def _begin(self, endpoint: str) -> bool:
+        """Count, delay and maybe fail a request. Returns False if it was answered."""
+        self.state.count(endpoint)
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        code = self.state.fault()
+        if code == 429:
+            self._send_json(429, {"error": "Too many requests"}, {"Retry-After": "1"})
+            return False
+        if code:
+            self._send_json(code, {"error": "Injected server error"})
+            return False
+        return True
+
+    def do_POST(self):
+        path = self.path.split("?")[0]
+        if path in ("/v1/text_to_video", "/v1/image_to_video"):
+            payload = self._read_json()
+            if not self._begin(path):
+                return
+            task_id = self.state.create_task(int(payload.get("duration", 8)))
+            self._send_json(200, {"id": task_id})
+        elif path == "/tts/bytes":
+            payload = self._read_json()
+            if not self._begin(path):
+                return
+            # Roughly 15 characters per second of narration
+            seconds = max(1.0, len(payload.get("transcript", "")) / 15)
+            sample_rate = payload.get("output_format", {}).get("sample_rate", 44100)
+            body = make_wav(seconds, sample_rate)
+            self.send_response(200)
+            self.send_header("Content-Type", "audio/wav")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif path == "/tts/sse":
+            payload = self._read_json()
+            if not self._begin(path):
+                return
+            seconds = max(1.0, len(payload.get("transcript", "")) / 15)
+            sample_rate = payload.get("output_format", {}).get("sample_rate", 44100)
+            pcm = make_pcm(seconds, sample_rate)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            # 100ms of audio per event, like Cartesia's chunked stream
+            step = sample_rate // 10 * 2
+            for offset in range(0, len(pcm), step):
+                event = {"type": "chunk", "data": base64.b64encode(pcm[offset:offset + step]).decode(),
+                         "done": False}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+            self.wfile.write(f"data: {json.dumps({'type': 'done', 'done': True})}\n\n".encode())
+            self.close_connection = True
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {path}"})
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path.startswith("/v1/tasks/"):
+            if not self._begin("/v1/tasks"):
+                return
+            status = self.state.task_status(path.rsplit("/", 1)[1])
+            if status is None:
+                self._send_json(404, {"error": "Task not found"})
+                return
+            if status["status"] == "SUCCEEDED":
+                host = self.headers.get("Host", "127.0.0.1")
+                status["output"] = [f"http://{host}/assets/{status['id']}.mp4"]
+            self._send_json(200, status)
+        elif path.startswith("/assets/"):
+            self._send_asset(path)
+        elif path == "/voices":
+            if not self._begin(path):
+                return
+            self._send_json(200, [
+                {"id": "mock-voice-1", "name": "Mock Narrator", "description": "Synthetic sine tone"},
+                {"id": "mock-voice-2", "name": "Mock Narrator (Low)", "description": "Synthetic sine tone"},
+            ])
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {path}"})
+
+    def _send_asset(self, path: str):
+        self.state.count("/assets")
+        task_id = Path(path).stem
+        task = self.state.tasks.get(task_id)
+        if task is None:
+            self._send_json(404, {"error": "Asset not found"})
+            return
+
+        body = self.state.asset(task["duration"])
+        start, end = 0, len(body) - 1
+        range_header = self.headers.get("Range", "")
+        if range_header.startswith("bytes="):
+            first, _, last = range_header[6:].partition("-")
+            start = int(first or 0)
+            end = int(last) if last else end
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(body[start:end + 1])
+
+
+# ========================================
+# Server
+# ========================================
+
+class MockAPIServer:
+    """Runs the mock API on a background thread (for benchmarks and scripts)."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, verbose: bool = False, **state_options):
+        self.state = MockState(**state_options)
+        self.httpd = ThreadingHTTPServer((host, port), MockHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state
+        self.httpd.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockAPIServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Runway + Cartesia stand-in API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--render-time", type=float, default=3.0,
+                        help="Seconds each task spends RUNNING (default: 3)")
+    parser.add_argument("--queue-depth", type=int, default=4,
+                        help="Max tasks RUNNING at once; the rest stay PENDING (default: 4)")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Added latency per API request in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of API requests answered with 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0,
+                        help="Fraction of API requests answered with 429 + Retry-After")
+    parser.add_argument("--task-failure-rate", type=float, default=0.0,
+                        help="Fraction of tasks that end FAILED")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible fault injection")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server = MockAPIServer(
+        args.host, args.port, verbose=args.verbose,
+        render_time=args.render_time,
+        queue_depth=args.queue_depth,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        task_failure_rate=args.task_failure_rate,
+        seed=args.seed,
+    )
+    print(f"🧪 Mock Runway/Cartesia API on {server.base_url}")
+    print(f"   export RUNWAY_API_URL={server.base_url} CARTESIA_API_URL={server.base_url}")
+    print("   export RUNWAY_API_KEY=mock CARTESIA_API_KEY=mock")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,21 +8,18 @@ Usage:
     python scripts/post.py monday       # Force specific day
     python scripts/post.py EC-001       # Use specific post ID
     python scripts/post.py --list       # Show all scheduled posts
+    python scripts/post.py --list --week week1 --vertical hvac --json
+    python scripts/post.py --range 30     # Posting calendar for the next 30 days
+    python scripts/post.py EC-001 --range 2026-01-01:2026-03-31
 """
 
+import argparse
 import json
-import os
-import re
 import sys
-import webbrowser
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
-try:
-    import pyperclip
-except ImportError:
-    print("❌ pyperclip not installed. Run: pip install pyperclip")
-    sys.exit(1)
+from post_index import PostIndex, rotation_week
 
 
 # Project paths
@@ -32,112 +29,175 @@ SCHEDULE_FILE = POSTS_DIR / "schedule.json"
 LINKEDIN_URL = "https://www.linkedin.com/feed/"
 
 
-def load_schedule():
-    """Load the posting schedule from JSON."""
+def load_schedule(index):
+    """Return the posting schedule (cached by the post index)."""
     if not SCHEDULE_FILE.exists():
         print(f"❌ Schedule file not found: {SCHEDULE_FILE}")
         sys.exit(1)
 
-    with open(SCHEDULE_FILE, "r") as f:
-        return json.load(f)
+    return index.schedule
 
 
-def get_current_week():
-    """Get current week number (1-4, cycling)."""
-    week_num = datetime.now().isocalendar()[1] % 4
-    return f"week{week_num if week_num > 0 else 4}"
-
-
-def get_today():
-    """Get today's day name (lowercase)."""
-    return datetime.now().strftime("%A").lower()
-
-
-def extract_post_content(filepath):
-    """Extract the post copy from a markdown file.
+def copy_and_open(post_content):
+    """Copy the post to the clipboard and open LinkedIn.
 
-    Looks for content between ``` markers after '## Post Copy'.
+    The clipboard and browser backends are imported here, not at startup,
+    so --list and --range never pay for them (or need pyperclip installed).
     """
-    if not filepath.exists():
-        print(f"❌ Post file not found: {filepath}")
+    try:
+        import pyperclip
+    except ImportError:
+        print("❌ pyperclip not installed. Run: pip install pyperclip")
         sys.exit(1)
+    import webbrowser
 
-    content = filepath.read_text()
+    # Copy to clipboard
+    pyperclip.copy(post_content)
+    print("📋 Copied to clipboard!")
 
-    # Find content between ``` markers in the Post Copy section
-    pattern = r"## Post Copy\s*```\s*(.*?)\s*```"
-    match = re.search(pattern, content, re.DOTALL)
+    # Open LinkedIn
+    print("🌐 Opening LinkedIn...")
+    webbrowser.open(LINKEDIN_URL)
 
-    if match:
-        return match.group(1).strip()
+    print("\n✅ Ready! Click 'Start a post' and paste (Cmd+V)\n")
 
-    # Fallback: look for any ``` block
-    pattern = r"```\s*(.*?)\s*```"
-    match = re.search(pattern, content, re.DOTALL)
 
-    if match:
-        return match.group(1).strip()
+def get_current_week():
+    """Get current week key (week1-week4, cycling continuously across years)."""
+    return rotation_week(date.today())
 
-    print(f"❌ Could not extract post content from: {filepath}")
-    sys.exit(1)
 
+def get_today():
+    """Get today's day name (lowercase)."""
+    return datetime.now().strftime("%A").lower()
 
-def extract_post_title(filepath):
-    """Extract post title/ID from the markdown file."""
-    content = filepath.read_text()
 
-    # Look for first heading
-    match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-    if match:
-        return match.group(1).strip()
+def load_post(record, index):
+    """Return (title, post copy) for an indexed post, exiting if it has no copy."""
+    if not record.copy:
+        print(f"❌ Could not extract post content from: {index.path(record)}")
+        sys.exit(1)
+    return record.title, record.copy
 
-    return filepath.stem
 
+def find_post_by_id(post_id, index):
+    """Find a post by its ID (e.g., EC-001), or by part of its file name."""
+    return index.find(post_id)
 
-def find_post_by_id(post_id, schedule):
-    """Find a post file by its ID (e.g., EC-001)."""
-    post_id_upper = post_id.upper()
 
-    for week, days in schedule.items():
-        for day, filepath in days.items():
-            if post_id_upper in filepath.upper():
-                return POSTS_DIR / filepath
+def list_scheduled_posts(index, week=None, vertical=None, as_json=False):
+    """Print scheduled posts from the index's resolved schedule view."""
+    slots = index.schedule_view(week=week, vertical=vertical)
 
-    # Try direct file search
-    for md_file in POSTS_DIR.rglob("*.md"):
-        if post_id_upper in md_file.stem.upper():
-            return md_file
+    if as_json:
+        print(json.dumps([slot.to_dict() for slot in slots], indent=2))
+        return
 
-    return None
+    print("\n📅 Scheduled Posts:\n")
+    if not slots:
+        print("  (no matching slots)\n")
+        return
 
+    current_week = None
+    for slot in slots:
+        if slot.week != current_week:
+            if current_week is not None:
+                print()
+            current_week = slot.week
+            print(f"  {slot.week.upper()}:")
+        if slot.record:
+            print(f"    {slot.day.capitalize():12} → {slot.record.title}")
+        else:
+            print(f"    {slot.day.capitalize():12} → {slot.path} (NOT FOUND)")
+    print()
+
+
+def parse_range(spec, today):
+    """Parse --range: "30" (next 30 days) or "START:END" ISO dates (either may be empty)."""
+    if spec.isdigit():
+        return today, today + timedelta(days=max(1, int(spec)) - 1)
+    start_text, sep, end_text = spec.partition(":")
+    if not sep:
+        raise ValueError(spec)
+    start = date.fromisoformat(start_text) if start_text else today
+    end = date.fromisoformat(end_text) if end_text else start + timedelta(days=29)
+    if end < start:
+        raise ValueError(spec)
+    return start, end
+
+
+def show_calendar(index, start, end, post_id=None, as_json=False):
+    """Print the dated posting calendar for a range, with gaps and repeats."""
+    report = index.calendar(start, end, post_id=post_id)
+
+    if as_json:
+        print(json.dumps(report.to_dict(), indent=2))
+        return
 
-def list_scheduled_posts(schedule):
-    """Print all scheduled posts."""
-    print("\n📅 Scheduled Posts:\n")
+    print(f"\n📅 Calendar {start} → {end} ({len(report.entries)} posts)\n")
+    for entry in report.entries:
+        record = entry.slot.record
+        title = record.title if record else f"{entry.slot.path} (NOT FOUND)"
+        print(f"  {entry.date:%a %Y-%m-%d}  {entry.week:8} {title}")
 
-    for week, days in schedule.items():
-        print(f"  {week.upper()}:")
-        for day, filepath in days.items():
-            full_path = POSTS_DIR / filepath
-            if full_path.exists():
-                title = extract_post_title(full_path)
-                print(f"    {day.capitalize():12} → {title}")
-            else:
-                print(f"    {day.capitalize():12} → {filepath} (NOT FOUND)")
+    if not post_id:
         print()
+        if report.gaps:
+            print(f"⚠️  Gaps ({len(report.gaps)}): " + ", ".join(f"{day:%a %m-%d}" for day in report.gaps))
+        if report.duplicates:
+            print("🔁 Repeats: " + ", ".join(
+                f"{pid} ×{len(days)}" for pid, days in sorted(report.duplicates.items())
+            ))
+    print()
 
 
 def main():
-    schedule = load_schedule()
+    parser = argparse.ArgumentParser(
+        description="Copy today's scheduled post to the clipboard and open LinkedIn"
+    )
+    parser.add_argument(
+        "target",
+        nargs="?",
+        help="Day name (e.g., monday) or post ID (e.g., EC-001); default: today"
+    )
+    parser.add_argument("--list", action="store_true", help="Show all scheduled posts")
+    parser.add_argument("--json", action="store_true", help="With --list or --range: print JSON")
+    parser.add_argument("--week", help="With --list: only this schedule week (e.g., week1)")
+    parser.add_argument("--vertical", help="With --list: only this vertical (e.g., HVAC or HV)")
+    parser.add_argument(
+        "--range",
+        metavar="DAYS|START:END",
+        help="Show the posting calendar for the next DAYS days or an ISO date range, "
+             "with gaps and repeats (give a post ID to see only its dates)"
+    )
+    args = parser.parse_args()
+
+    index = PostIndex.load(POSTS_DIR)
+    schedule = load_schedule(index)
 
     # Handle --list flag
-    if len(sys.argv) > 1 and sys.argv[1] == "--list":
-        list_scheduled_posts(schedule)
+    if args.list:
+        list_scheduled_posts(index, week=args.week, vertical=args.vertical, as_json=args.json)
+        return
+
+    if args.range:
+        try:
+            start, end = parse_range(args.range, date.today())
+        except ValueError:
+            parser.error(f"--range expects DAYS or START:END (YYYY-MM-DD), got: {args.range}")
+        post_id = None
+        if args.target:
+            record = find_post_by_id(args.target, index)
+            if not record:
+                print(f"❌ Post not found: {args.target}")
+                sys.exit(1)
+            post_id = record.post_id
+        show_calendar(index, start, end, post_id=post_id, as_json=args.json)
         return
 
     # Determine which post to use
-    if len(sys.argv) > 1:
-        arg = sys.argv[1].lower()
+    if args.target:
+        arg = args.target.lower()
 
         # Check if it's a day name
         if arg in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]:
@@ -145,21 +205,16 @@ def main():
             week = get_current_week()
         else:
             # Assume it's a post ID
-            post_file = find_post_by_id(sys.argv[1], schedule)
-            if not post_file:
-                print(f"❌ Post not found: {sys.argv[1]}")
+            record = find_post_by_id(args.target, index)
+            if not record:
+                print(f"❌ Post not found: {args.target}")
                 print("   Try: python scripts/post.py --list")
                 sys.exit(1)
 
-            post_content = extract_post_content(post_file)
-            post_title = extract_post_title(post_file)
+            post_title, post_content = load_post(record, index)
 
             print(f"\n📝 Loading post: {post_title}")
-            pyperclip.copy(post_content)
-            print("📋 Copied to clipboard!")
-            print("🌐 Opening LinkedIn...")
-            webbrowser.open(LINKEDIN_URL)
-            print("\n✅ Ready! Click 'Start a post' and paste (Cmd+V)\n")
+            copy_and_open(post_content)
             return
     else:
         day = get_today()
@@ -176,21 +231,14 @@ def main():
         print("   Or run: python scripts/post.py EC-001")
         return
 
-    post_path = POSTS_DIR / week_schedule[day]
-    post_content = extract_post_content(post_path)
-    post_title = extract_post_title(post_path)
+    record = index.by_path(week_schedule[day])
+    if not record:
+        print(f"❌ Post file not found: {POSTS_DIR / week_schedule[day]}")
+        sys.exit(1)
+    post_title, post_content = load_post(record, index)
 
     print(f"📝 Loading post: {post_title}")
-
-    # Copy to clipboard
-    pyperclip.copy(post_content)
-    print("📋 Copied to clipboard!")
-
-    # Open LinkedIn
-    print("🌐 Opening LinkedIn...")
-    webbrowser.open(LINKEDIN_URL)
-
-    print("\n✅ Ready! Click 'Start a post' and paste (Cmd+V)\n")
+    copy_and_open(post_content)
 
 
 if __name__ == "__main__":
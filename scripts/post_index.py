@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Post Index
+
+Parses every posts/**/*.md once into a compact PostRecord and keeps the
+records in an on-disk cache keyed by path + mtime + size, so a run only
+re-parses files that changed. Lookups by post ID are dict hits.
+
+Shared by post.py and generate_video.py:
+
+    from post_index import PostIndex
+
+    index = PostIndex.load()
+    record = index.get("EC-001")
+    print(record.title, record.pain_point, index.path(record))
+
+Usage:
+    python scripts/post_index.py            # Rebuild and summarize the index
+    python scripts/post_index.py EC-001     # Show one record
+"""
+
+import json
+import re
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+# Project paths
+PROJECT_ROOT = Path(__file__).parent.parent
+POSTS_DIR = PROJECT_ROOT / "posts"
+INDEX_FILE_NAME = ".post_index.json"
+
+# Bump when PostRecord or the parser changes so stale caches are rebuilt
+INDEX_VERSION = 3
+
+# schedule.json rotates week1..weekN; weeks count continuously from the
+# anchor so the cycle doesn't restart at ISO week 1 (53-week years).
+# The anchor is the Monday of ISO week 1, 2025, which keeps the old
+# "ISO week % 4" assignment for every week through 2026.
+ROTATION_WEEKS = 4
+ROTATION_ANCHOR = date(2024, 12, 30)
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+POST_ID_PATTERN = re.compile(r"[A-Z]{2}-\d{3}", re.IGNORECASE)
+FIELD_PATTERN = re.compile(r"^\*\*(.+?):\*\*\s*(.*)$")
+
+
+# ========================================
+# Records
+# ========================================
+
+# Plain slotted classes rather than dataclasses: importing dataclasses
+# pulls in inspect, which costs more than the rest of post.py's startup.
+
+class PostRecord:
+    """What the scripts need from one post file."""
+
+    __slots__ = ("post_id", "title", "path", "vertical", "pain_point", "copy", "fields", "tracking", "slots")
+
+    def __init__(
+        self,
+        post_id: str,
+        title: str,
+        path: str,
+        vertical: str = "",
+        pain_point: str = "",
+        copy: str = "",
+        fields: Optional[Dict[str, str]] = None,
+        tracking: Optional[Dict[str, str]] = None,
+        slots: Optional[List[str]] = None,
+    ):
+        self.post_id = post_id
+        self.title = title
+        self.path = path  # Relative to the posts directory
+        self.vertical = vertical
+        self.pain_point = pain_point
+        self.copy = copy
+        self.fields = fields or {}  # Every **Key:** value, as written
+        self.tracking = tracking or {}  # "## Tracking" table: metric -> result
+        self.slots = slots or []  # Schedule slots, e.g. "week1/monday"
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ScheduleSlot:
+    """One schedule.json entry, resolved to its post (None if the file is missing)."""
+
+    __slots__ = ("week", "day", "path", "record")
+
+    def __init__(self, week: str, day: str, path: str, record: Optional[PostRecord] = None):
+        self.week = week
+        self.day = day
+        self.path = path
+        self.record = record
+
+    def to_dict(self) -> dict:
+        record = self.record
+        return {
+            "week": self.week,
+            "day": self.day,
+            "path": self.path,
+            "post_id": record.post_id if record else None,
+            "title": record.title if record else None,
+            "vertical": record.vertical if record else None,
+            "pain_point": record.pain_point if record else None,
+        }
+
+
+class CalendarEntry:
+    """A dated posting slot."""
+
+    __slots__ = ("date", "week", "slot")
+
+    def __init__(self, day: date, week: str, slot: ScheduleSlot):
+        self.date = day
+        self.week = week  # The schedule.json key that applies (e.g. "week2" or "default")
+        self.slot = slot
+
+    def to_dict(self) -> dict:
+        return {"date": self.date.isoformat(), **self.slot.to_dict(), "week": self.week}
+
+
+class CalendarReport:
+    """Everything a date-range query produces, built in one pass."""
+
+    __slots__ = ("start", "end", "entries", "gaps", "duplicates")
+
+    def __init__(
+        self,
+        start: date,
+        end: date,
+        entries: List[CalendarEntry],
+        gaps: List[date],
+        duplicates: Dict[str, List[date]],
+    ):
+        self.start = start
+        self.end = end
+        self.entries = entries
+        self.gaps = gaps  # Posting weekdays with no slot or a missing post file
+        self.duplicates = duplicates  # Post ID -> dates, for posts that run more than once
+
+    def to_dict(self) -> dict:
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "entries": [entry.to_dict() for entry in self.entries],
+            "gaps": [day.isoformat() for day in self.gaps],
+            "duplicates": {post_id: [day.isoformat() for day in days]
+                           for post_id, days in self.duplicates.items()},
+        }
+
+
+def rotation_week(day: date) -> str:
+    """The rotating week key (week1..week4) for a date."""
+    weeks = (day - ROTATION_ANCHOR).days // 7
+    return f"week{weeks % ROTATION_WEEKS + 1}"
+
+
+def parse_post(path: Path, rel_path: str) -> PostRecord:
+    """Parse one markdown post into a PostRecord in a single pass.
+
+    The file is read line by line once, picking up:
+        - the title (first "# " heading)
+        - every **Key:** value line (first occurrence wins)
+        - the ``` block under "## Post Copy" (else the first ``` block)
+        - the two-column table under "## Tracking"
+    """
+    title = None
+    fields: Dict[str, str] = {}
+    declared_ids = []
+    tracking: Dict[str, str] = {}
+    section = ""
+    block: Optional[List[str]] = None  # Lines of the open ``` block
+    copy = first_block = None
+    table_rows = 0
+
+    with open(path) as f:
+        for raw in f:
+            line = raw.rstrip("\n")
+            stripped = line.strip()
+
+            if block is not None:
+                if stripped.startswith("```"):
+                    text = "\n".join(block).strip()
+                    if first_block is None:
+                        first_block = text
+                    if section == "post copy" and copy is None:
+                        copy = text
+                    block = None
+                else:
+                    block.append(line)
+                continue
+
+            if stripped.startswith("```"):
+                block = []
+            elif line.startswith("## "):
+                section = line[3:].strip().lower()
+            elif line.startswith("# "):
+                if title is None:
+                    title = line[2:].strip()
+            elif stripped.startswith("**"):
+                match = FIELD_PATTERN.match(stripped)
+                if match:
+                    key, value = match.group(1).strip(), match.group(2).strip()
+                    fields.setdefault(key, value)
+                    if key.lower() == "post id":
+                        declared_ids.append(value)
+            elif section == "tracking" and stripped.startswith("|"):
+                cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+                table_rows += 1
+                # Skip the header row and the |---|---| separator
+                if table_rows > 1 and not set(cells[0]) <= set("-: "):
+                    tracking[cells[0]] = cells[1] if len(cells) > 1 else ""
+
+    lowered = {key.lower(): value for key, value in fields.items()}
+
+    # The file name names the post; a lone **Post ID:** covers other names.
+    # Files declaring several IDs (templates) are indexed under their stem.
+    id_match = POST_ID_PATTERN.search(path.stem)
+    if not id_match and len(declared_ids) == 1:
+        id_match = POST_ID_PATTERN.search(declared_ids[0])
+    return PostRecord(
+        post_id=id_match.group(0).upper() if id_match else path.stem.upper(),
+        title=title or path.stem,
+        path=rel_path,
+        vertical=lowered.get("vertical", ""),
+        pain_point=lowered.get("pain point", ""),
+        copy=copy if copy is not None else (first_block or ""),
+        fields=fields,
+        tracking=tracking,
+    )
+
+
+# ========================================
+# Index
+# ========================================
+
+class PostIndex:
+    """Post records by ID, backed by an mtime/size-validated cache file."""
+
+    def __init__(self, posts_dir: Path = POSTS_DIR, cache_file: Optional[Path] = None):
+        self.posts_dir = posts_dir
+        self.cache_file = cache_file or posts_dir / INDEX_FILE_NAME
+        self.schedule: dict = {}
+        self.slots: List[ScheduleSlot] = []  # schedule.json resolved once, in file order
+        self.parsed = 0  # Files (re-)parsed by the last refresh
+        self._records: Dict[str, PostRecord] = {}
+        self._by_path: Dict[str, PostRecord] = {}
+
+    @classmethod
+    def load(cls, posts_dir: Path = POSTS_DIR) -> "PostIndex":
+        """Build an index, re-parsing only files changed since the cache."""
+        index = cls(posts_dir)
+        index.refresh()
+        return index
+
+    def _read_cache(self) -> dict:
+        try:
+            cache = json.loads(self.cache_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if cache.get("version") != INDEX_VERSION:
+            return {}
+        return cache
+
+    def refresh(self):
+        """Sync the index with the posts directory.
+
+        Files (and schedule.json) are matched to cache entries by relative
+        path, mtime and size; only new or changed files are read. The cache
+        file is rewritten only when something changed.
+        """
+        cache = self._read_cache()
+        cached = cache.get("files", {})
+        files = {}
+        self.parsed = 0
+        schedule_entry = self._schedule_entry(cache.get("schedule"))
+
+        for md_file in sorted(self.posts_dir.rglob("*.md")):
+            rel_path = md_file.relative_to(self.posts_dir).as_posix()
+            stat = md_file.stat()
+            entry = cached.get(rel_path)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                files[rel_path] = entry
+                continue
+            record = parse_post(md_file, rel_path)
+            files[rel_path] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "record": record.to_dict(),
+            }
+            self.parsed += 1
+
+        if self.parsed or files.keys() != cached.keys() or schedule_entry is not cache.get("schedule"):
+            try:
+                tmp_path = self.cache_file.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps({
+                    "version": INDEX_VERSION,
+                    "files": files,
+                    "schedule": schedule_entry,
+                }))
+                tmp_path.replace(self.cache_file)
+            except OSError:
+                pass  # Read-only checkout: the index still works in memory
+
+        self._by_path = {}
+        self._records = {}
+        for rel_path, entry in files.items():
+            record = PostRecord(**entry["record"])
+            record.slots = []
+            self._by_path[rel_path] = record
+            # First file wins if two posts claim the same ID
+            self._records.setdefault(record.post_id, record)
+
+        self._load_schedule(schedule_entry["data"] if schedule_entry else {})
+
+    def _schedule_entry(self, cached: Optional[dict]) -> Optional[dict]:
+        """schedule.json contents, from the cache if the file is unchanged."""
+        schedule_file = self.posts_dir / "schedule.json"
+        try:
+            stat = schedule_file.stat()
+            if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                return cached
+            data = json.loads(schedule_file.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data}
+
+    def _load_schedule(self, schedule: dict):
+        self.schedule = schedule
+        self.slots = []
+        for week, days in self.schedule.items():
+            for day, rel_path in days.items():
+                record = self._by_path.get(rel_path)
+                if record:
+                    record.slots.append(f"{week}/{day}")
+                self.slots.append(ScheduleSlot(week, day, rel_path, record))
+
+    def schedule_view(self, week: Optional[str] = None, vertical: Optional[str] = None) -> List[ScheduleSlot]:
+        """Scheduled slots, optionally limited to one week key and/or vertical.
+
+        `vertical` matches the post's **Vertical:** (e.g. "hvac") or its ID
+        prefix (e.g. "HV"), case-insensitively.
+        """
+        slots = self.slots
+        if week:
+            slots = [slot for slot in slots if slot.week.lower() == week.lower()]
+        if vertical:
+            wanted = vertical.lower()
+            slots = [
+                slot for slot in slots
+                if slot.record and wanted in (slot.record.vertical.lower(), slot.record.post_id[:2].lower())
+            ]
+        return slots
+
+    def week_for(self, day: date) -> str:
+        """The schedule.json key in effect on a date (falls back to "default")."""
+        week = rotation_week(day)
+        return week if week in self.schedule else "default"
+
+    def calendar(self, start: date, end: date, post_id: Optional[str] = None) -> CalendarReport:
+        """Expand the schedule over [start, end] into dated entries.
+
+        Gaps are posting weekdays (any weekday the schedule uses) without a
+        resolvable post; duplicates are posts that run more than once in
+        the range. Pass `post_id` to keep only that post's entries.
+        """
+        slots_by_week: Dict[str, Dict[str, ScheduleSlot]] = {}
+        for slot in self.slots:
+            slots_by_week.setdefault(slot.week, {})[slot.day] = slot
+        posting_days = {slot.day for slot in self.slots}
+        wanted = post_id.upper() if post_id else None
+
+        entries, gaps = [], []
+        runs: Dict[str, List[date]] = {}
+        day = start
+        while day <= end:
+            day_name = DAY_NAMES[day.weekday()]
+            if day_name in posting_days:
+                week = self.week_for(day)
+                slot = slots_by_week.get(week, {}).get(day_name)
+                if slot is None or slot.record is None:
+                    gaps.append(day)
+                if slot is not None and (not wanted or (slot.record and slot.record.post_id == wanted)):
+                    entries.append(CalendarEntry(day, week, slot))
+                    if slot.record:
+                        runs.setdefault(slot.record.post_id, []).append(day)
+            day += timedelta(days=1)
+
+        duplicates = {pid: days for pid, days in runs.items() if len(days) > 1}
+        return CalendarReport(start, end, entries, gaps, duplicates)
+
+    def get(self, post_id: str) -> Optional[PostRecord]:
+        """Look up a post by exact ID (case-insensitive)."""
+        return self._records.get(post_id.upper())
+
+    def find(self, query: str) -> Optional[PostRecord]:
+        """Look up by ID, falling back to a substring of the file name."""
+        record = self.get(query)
+        if record:
+            return record
+        needle = query.upper()
+        for rel_path, record in self._by_path.items():
+            if needle in Path(rel_path).stem.upper():
+                return record
+        return None
+
+    def by_path(self, rel_path: str) -> Optional[PostRecord]:
+        """Look up by path relative to the posts directory (as in schedule.json)."""
+        return self._by_path.get(rel_path)
+
+    def path(self, record: PostRecord) -> Path:
+        """Absolute path of a record's markdown file."""
+        return self.posts_dir / record.path
+
+    def __iter__(self) -> Iterator[PostRecord]:
+        return iter(self._by_path.values())
+
+    def __len__(self) -> int:
+        return len(self._by_path)
+
+
+def main():
+    index = PostIndex.load()
+
+    if len(sys.argv) > 1:
+        record = index.find(sys.argv[1])
+        if not record:
+            print(f"❌ Post not found: {sys.argv[1]}")
+            sys.exit(1)
+        print(json.dumps(record.to_dict(), indent=2))
+        return
+
+    print(f"\n📚 {len(index)} posts indexed ({index.parsed} parsed, "
+          f"{len(index) - index.parsed} from cache)\n")
+    for record in index:
+        slots = ", ".join(record.slots) if record.slots else "unscheduled"
+        print(f"  {record.post_id:16} {record.title[:40]:40} {slots}")
+    print()
+
+
+if __name__ == "__main__":
+    main()